@@ -0,0 +1,175 @@
+import hashlib
+import hmac
+import io
+import os
+import pickle
+import stat
+import struct
+import tempfile
+from compiler.codeObjects import GameProgram
+
+ERROR_HANDLER_PERSISTENT_ID = 'errorHandler'
+
+
+class ArtifactPickler(pickle.Pickler):
+
+    def __init__(self, file, errorHandler=None):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__errorHandler = errorHandler
+
+    def persistent_id(self, obj):
+        if self.__errorHandler is not None and obj is self.__errorHandler:
+            return ERROR_HANDLER_PERSISTENT_ID
+        return None
+
+
+class ArtifactUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, errorHandler=None):
+        super().__init__(file)
+        self.__errorHandler = errorHandler
+
+    def persistent_load(self, persistentId):
+        if persistentId == ERROR_HANDLER_PERSISTENT_ID:
+            return self.__errorHandler
+        raise pickle.UnpicklingError(f"Unknown persistent id {persistentId}")
+
+
+class ArtifactCache:
+    __magic = b'CGC\0'
+    __formatVersion = 2
+    __header = struct.Struct('>4sH32s32s')
+    __secretFileName = 'artifact-secret.key'
+    __secretSize = 32
+    __filePrefix = 'game-'
+    __fileSuffix = '.cgc'
+    __compilerFingerprint = None
+
+    def __init__(self, directory: str = None, maxArtifacts: int = 256):
+        assert maxArtifacts >= 1, "The cache must keep at least one artifact"
+        self.__directory = directory
+        self.__maxArtifacts = maxArtifacts
+        self.__secret = None
+
+    @staticmethod
+    def __openTrusted(path: str, flags: int = os.O_RDONLY, mode: int = 0o600):
+        fileDescriptor = os.open(path, flags | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_BINARY', 0), mode)
+        fileStat = os.fstat(fileDescriptor)
+        isOwnedByUser = not hasattr(os, 'getuid') or fileStat.st_uid == os.getuid()
+        isWritableByOthers = fileStat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        if not stat.S_ISREG(fileStat.st_mode) or not isOwnedByUser or isWritableByOthers:
+            os.close(fileDescriptor)
+            raise PermissionError(f"Refusing untrusted cache file {path}")
+        return os.fdopen(fileDescriptor, 'rb' if flags == os.O_RDONLY else 'wb')
+
+    def __getSecret(self):
+        if self.__secret is None:
+            path = os.path.join(self.__directory, self.__secretFileName)
+            try:
+                with self.__openTrusted(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL) as secretFile:
+                    secretFile.write(os.urandom(self.__secretSize))
+            except FileExistsError:
+                pass
+            with self.__openTrusted(path) as secretFile:
+                secret = secretFile.read(self.__secretSize + 1)
+            if len(secret) != self.__secretSize:
+                raise PermissionError(f"Refusing malformed cache secret {path}")
+            self.__secret = secret
+        return self.__secret
+
+    def __sign(self, key: bytes, payload: bytes):
+        return hmac.new(self.__getSecret(), key + payload, hashlib.sha256).digest()
+
+    @staticmethod
+    def __getCompilerFingerprint():
+        if ArtifactCache.__compilerFingerprint is None:
+            fingerprint = hashlib.sha256(f"{ArtifactCache.__formatVersion}\n".encode('utf-8'))
+            compilerDirectory = os.path.dirname(os.path.abspath(__file__))
+            for directory, _, fileNames in sorted(os.walk(compilerDirectory)):
+                for fileName in sorted(fileNames):
+                    if fileName.endswith('.py'):
+                        path = os.path.join(directory, fileName)
+                        fingerprint.update(os.path.relpath(path, compilerDirectory).encode('utf-8'))
+                        with open(path, 'rb') as sourceFile:
+                            fingerprint.update(sourceFile.read())
+            ArtifactCache.__compilerFingerprint = fingerprint.hexdigest()
+        return ArtifactCache.__compilerFingerprint
+
+    def isEnabled(self):
+        return self.__directory is not None
+
+    def getKey(self, sourceLines, W: int, H: int, fps: int, hasErrorHandler: bool):
+        key = hashlib.sha256(f"{self.__getCompilerFingerprint()}\n{W}\n{H}\n{fps}\n{hasErrorHandler}\n".encode('utf-8'))
+        for line in sourceLines:
+            key.update(line.encode('utf-8'))
+        return key.digest()
+
+    def __getFilePath(self, key: bytes):
+        return os.path.join(self.__directory, f"{self.__filePrefix}{key.hex()[:32]}{self.__fileSuffix}")
+
+    def __markUsed(self, path: str):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def __evictOldArtifacts(self):
+        artifacts = []
+        try:
+            with os.scandir(self.__directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(self.__filePrefix) and entry.name.endswith(self.__fileSuffix) and entry.is_file(follow_symlinks=False):
+                        artifacts.append((entry.stat(follow_symlinks=False).st_mtime, entry.path))
+        except OSError:
+            return
+        artifacts.sort(reverse=True)
+        for _, path in artifacts[self.__maxArtifacts:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def load(self, key: bytes, errorHandler=None):
+        if not self.isEnabled():
+            return None
+        path = self.__getFilePath(key)
+        try:
+            with self.__openTrusted(path) as artifactFile:
+                magic, formatVersion, storedKey, signature = self.__header.unpack(artifactFile.read(self.__header.size))
+                if magic != self.__magic or formatVersion != self.__formatVersion or storedKey != key:
+                    return None
+                payload = artifactFile.read()
+            if not hmac.compare_digest(signature, self.__sign(key, payload)):
+                return None
+            program = ArtifactUnpickler(io.BytesIO(payload), errorHandler).load()
+        except Exception:
+            return None
+        if not isinstance(program, GameProgram):
+            return None
+        self.__markUsed(path)
+        return program
+
+    def save(self, key: bytes, program: GameProgram, errorHandler=None):
+        if not self.isEnabled():
+            return
+        try:
+            os.makedirs(self.__directory, mode=0o700, exist_ok=True)
+            payloadFile = io.BytesIO()
+            ArtifactPickler(payloadFile, errorHandler).dump(program)
+            payload = payloadFile.getvalue()
+            signature = self.__sign(key, payload)
+            fileDescriptor, temporaryPath = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+        except (OSError, pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return
+        try:
+            with os.fdopen(fileDescriptor, 'wb') as artifactFile:
+                artifactFile.write(self.__header.pack(self.__magic, self.__formatVersion, key, signature))
+                artifactFile.write(payload)
+            os.replace(temporaryPath, self.__getFilePath(key))
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+            return
+        self.__evictOldArtifacts()
@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from compiler.main import Compiler, Backend, defaultArtifactCache
+from compiler.sourceReader import openSource
+
+EXIT_SUCCESS = 0
+EXIT_COMPILE_ERRORS = 1
+EXIT_USAGE_ERROR = 2
+EXIT_INTERNAL_ERROR = 3
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_CRASHED = 'crashed'
+
+SOURCE_FILE_EXTENSION = '.cg'
+WARM_UP_CODE = "~a\n\n~a{\n  $x = [1]\n}\n"
+
+
+class CompileError(Exception):
+    pass
+
+
+def raiseCompileError(message):
+    raise CompileError(message)
+
+
+def warmUpWorker():
+    Compiler(WARM_UP_CODE, 1, 1, 1, errorHandler=raiseCompileError, artifactCache=None).compile()
+
+
+def compileFile(path: str, W: int, H: int, fps: int, backend: str, useArtifactCache: bool, profile: bool = False, profileMemory: bool = False):
+    start = time.perf_counter()
+    status, error, compiler = STATUS_OK, None, None
+    try:
+        with openSource(path) as codeFile:
+            compiler = Compiler.fromSource(codeFile, W, H, fps, errorHandler=raiseCompileError, backend=backend,
+                                           artifactCache=defaultArtifactCache if useArtifactCache else None, profile=profile,
+                                           profileMemory=profileMemory)
+            compiler.compile()
+    except CompileError as e:
+        status, error = STATUS_ERROR, str(e)
+    except (OSError, UnicodeDecodeError) as e:
+        status, error = STATUS_ERROR, f"Cannot read file: {e}"
+    except Exception as e:
+        status, error = STATUS_CRASHED, f"{e.__class__.__name__}: {e}"
+    result = {'path': path, 'status': status, 'error': error, 'seconds': time.perf_counter() - start}
+    if profile:
+        result['profile'] = compiler.getProfile().toDict() if compiler is not None else None
+    return result
+
+
+def getCrashedResult(path: str, error: Exception, profile: bool = False):
+    result = {'path': path, 'status': STATUS_CRASHED, 'error': f"Worker failed: {error.__class__.__name__}: {error}", 'seconds': None}
+    if profile:
+        result['profile'] = None
+    return result
+
+
+def findSourceFiles(paths: [str]):
+    sourceFiles = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, fileNames in sorted(os.walk(path)):
+                sourceFiles += [os.path.join(directory, fileName) for fileName in sorted(fileNames) if fileName.endswith(SOURCE_FILE_EXTENSION)]
+        else:
+            sourceFiles.append(path)
+    return sourceFiles
+
+
+def compileFiles(sourceFiles: [str], W: int, H: int, fps: int, backend: str, useArtifactCache: bool, jobs: int, profile: bool = False,
+                 profileMemory: bool = False):
+    arguments = [(path, W, H, fps, backend, useArtifactCache, profile, profileMemory) for path in sourceFiles]
+    if jobs == 1 or len(sourceFiles) <= 1:
+        try:
+            warmUpWorker()
+        except Exception as e:
+            return [getCrashedResult(argument[0], e, profile) for argument in arguments]
+        return [compileFile(*argument) for argument in arguments]
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warmUpWorker) as executor:
+        futures = []
+        for argument in arguments:
+            try:
+                futures.append(executor.submit(compileFile, *argument))
+            except Exception as e:
+                futures.append(e)
+        for argument, future in zip(arguments, futures):
+            try:
+                if isinstance(future, Exception):
+                    raise future
+                results.append(future.result())
+            except Exception as e:
+                results.append(getCrashedResult(argument[0], e, profile))
+    return results
+
+
+def getExitCode(results):
+    statuses = {result['status'] for result in results}
+    if STATUS_CRASHED in statuses:
+        return EXIT_INTERNAL_ERROR
+    if STATUS_ERROR in statuses:
+        return EXIT_COMPILE_ERRORS
+    return EXIT_SUCCESS
+
+
+def getSummary(results, seconds: float):
+    def countStatus(status): return sum(1 for result in results if result['status'] == status)
+    return {
+        'files': len(results),
+        'succeeded': countStatus(STATUS_OK),
+        'failed': countStatus(STATUS_ERROR),
+        'crashed': countStatus(STATUS_CRASHED),
+        'seconds': seconds,
+    }
+
+
+def positiveInteger(value: str):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def parseArgs(args):
+    parser = argparse.ArgumentParser(prog='python -m compiler.batch', description='Compile many .cg files and report the results as JSON.')
+    parser.add_argument('paths', nargs='+', help='.cg files, or directories to search for .cg files')
+    parser.add_argument('--width', type=positiveInteger, default=30)
+    parser.add_argument('--height', type=positiveInteger, default=30)
+    parser.add_argument('--fps', type=positiveInteger, default=30)
+    parser.add_argument('--backend', choices=[Backend.INTERPRETER, Backend.CODEGEN], default=Backend.INTERPRETER)
+    parser.add_argument('--jobs', type=positiveInteger, default=os.cpu_count() or 1, help='number of worker processes')
+    parser.add_argument('--no-cache', action='store_true', help='always compile, ignoring cached .cgc artifacts')
+    parser.add_argument('--profile-compile', action='store_true', help='include per-phase compile timings and counters in each result')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='like --profile-compile, and also record peak allocations with tracemalloc (which slows the timed phases down)')
+    parser.add_argument('--output', help='write the JSON report to this file instead of the standard output')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    options = parseArgs(sys.argv[1:] if args is None else args)
+    sourceFiles = findSourceFiles(options.paths)
+    if len(sourceFiles) == 0:
+        print("Error: no .cg files found", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    start = time.perf_counter()
+    results = compileFiles(sourceFiles, options.width, options.height, options.fps, options.backend, not options.no_cache, options.jobs,
+                           options.profile_compile or options.profile_memory, options.profile_memory)
+    report = {'results': results, 'summary': getSummary(results, time.perf_counter() - start)}
+    if options.output is not None:
+        with open(options.output, 'w') as outputFile:
+            json.dump(report, outputFile, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return getExitCode(results)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
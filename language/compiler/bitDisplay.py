@@ -0,0 +1,100 @@
+from weakref import WeakKeyDictionary
+from compiler.codeObjects import ShapePixel, DirtyRegionTracker
+
+_shapeRowMasks = WeakKeyDictionary()
+_bitCharsToBytes = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def getRowMasks(pixelArray: [[ShapePixel]]):
+    rowMasks = []
+    for pixelRow in pixelArray:
+        opaqueMask = inkMask = 0
+        for column, shapePixel in enumerate(pixelRow):
+            if shapePixel != ShapePixel.TRANSPARENT:
+                opaqueMask |= 1 << column
+                if shapePixel == ShapePixel.BLACK:
+                    inkMask |= 1 << column
+        rowMasks.append((opaqueMask, inkMask))
+    return rowMasks
+
+
+def getShapeRowMasks(shape):
+    rowMasks = _shapeRowMasks.get(shape, None)
+    if rowMasks is None:
+        rowMasks = getRowMasks(shape.getShapePixelArray())
+        _shapeRowMasks[shape] = rowMasks
+    return rowMasks
+
+
+class BitDisplay(DirtyRegionTracker):
+    def __init__(self, pixelArray, W: int, H: int):
+        self.__W = W
+        self.__H = H
+        self._initDirtyRegion(W, H)
+        self.__rowMask = (1 << W) - 1
+        self.__rowFormat = f"0{W}b"
+        self.__clearedRows = [0] * H
+        self.__rows = [0] * H
+        for row, pixelRow in enumerate(pixelArray[:H]):
+            bits = 0
+            for column, pixel in enumerate(pixelRow[:W]):
+                if pixel:
+                    bits |= 1 << column
+            self.__rows[row] = bits
+
+    @staticmethod
+    def cleared(W: int, H: int):
+        return BitDisplay((), W, H)
+
+    def clear(self):
+        self.__rows[:] = self.__clearedRows
+        self._markCleared()
+
+    def __overlayRowMasks(self, rowMasks, width: int, topLeftCoordinate):
+        tlX, tlY = topLeftCoordinate
+        top, bottom = max(tlY, 0), min(tlY + len(rowMasks), self.__H)
+        left, right = max(tlX, 0), min(tlX + width, self.__W)
+        if top >= bottom or left >= right:
+            return
+        self._markDrawn(left, top, right, bottom)
+        rows = self.__rows
+        rowMask = self.__rowMask
+        firstRow = top - tlY
+        lastRow = bottom - tlY
+        for maskRow in range(firstRow, lastRow):
+            opaqueMask, inkMask = rowMasks[maskRow]
+            if tlX >= 0:
+                opaqueMask, inkMask = opaqueMask << tlX, inkMask << tlX
+            else:
+                opaqueMask, inkMask = opaqueMask >> -tlX, inkMask >> -tlX
+            row = tlY + maskRow
+            rows[row] = (rows[row] & ~opaqueMask) | (inkMask & rowMask)
+
+    def overlay(self, pixelArray: [[ShapePixel]], topLeftCoordinate=(0, 0)):
+        width = max((len(row) for row in pixelArray), default=0)
+        self.__overlayRowMasks(getRowMasks(pixelArray), width, topLeftCoordinate)
+
+    def overlayShape(self, shape, topLeftCoordinate=(0, 0)):
+        self.__overlayRowMasks(getShapeRowMasks(shape), shape.getWidth(), topLeftCoordinate)
+
+    def isPixelOn(self, row, column):
+        return bool(self.__rows[row] >> column & 1)
+
+    def getRows(self):
+        return self.__rows
+
+    def getPixelArray(self):
+        columns = range(self.__W)
+        return [[bool(bits >> column & 1) for column in columns] for bits in self.__rows]
+
+    def getPixelBytes(self):
+        rowFormat = self.__rowFormat
+        return b''.join(format(bits, rowFormat)[::-1].encode().translate(_bitCharsToBytes) for bits in self.__rows)
+
+    def __repr__(self):
+        onPixel = '#'
+        offPixel = '.'
+        def getPixelChar(pixel): return onPixel if pixel else offPixel
+        def rowMapper(row): return ''.join(map(getPixelChar, row))
+        allRowsString = '\n'.join(map(rowMapper, self.getPixelArray()))
+        return f"{self.__class__.__name__}(\n{allRowsString}\n)"
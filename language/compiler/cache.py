@@ -0,0 +1,18 @@
+import os
+import sys
+
+CACHE_DIRECTORY_ENV_VARIABLE = 'CONSOLE_GAME_CACHE_DIR'
+APPLICATION_NAME = 'console-game'
+
+
+def getCacheDirectory():
+    directory = os.environ.get(CACHE_DIRECTORY_ENV_VARIABLE)
+    if directory is not None:
+        return directory or None
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, APPLICATION_NAME)
@@ -0,0 +1,53 @@
+from contextlib import contextmanager
+
+
+class CodeGenerator:
+    __indent = '    '
+
+    def __init__(self):
+        self.__lines = []
+        self.__depth = 1
+        self.__namespace = {}
+        self.__numberOfNames = 0
+        self.__localNames = {}
+
+    def addLine(self, line: str):
+        self.__lines.append(self.__indent * self.__depth + line)
+
+    @contextmanager
+    def indented(self):
+        self.__depth += 1
+        try:
+            yield
+        finally:
+            self.__depth -= 1
+
+    def newName(self, prefix: str = 'value'):
+        name = f"_{prefix}{self.__numberOfNames}"
+        self.__numberOfNames += 1
+        return name
+
+    def getLocalName(self, key, prefix: str = 'value'):
+        if key not in self.__localNames:
+            self.__localNames[key] = self.newName(prefix)
+        return self.__localNames[key]
+
+    def bind(self, value, prefix: str = 'object'):
+        name = self.newName(prefix)
+        self.__namespace[name] = value
+        return name
+
+    def getSource(self, functionName: str):
+        lines = [
+            f"def {functionName}(game):",
+            f"{self.__indent}variables = game._getVariableFrame()",
+            f"{self.__indent}constants = game._getConstants()",
+        ]
+        lines += self.__lines
+        lines.append(f"{self.__indent}return")
+        return '\n'.join(lines) + '\n'
+
+    def compileFunction(self, functionName: str):
+        namespace = dict(self.__namespace)
+        exec(compile(self.getSource(functionName), f"<generated {functionName}>", 'exec'), namespace)
+        return namespace[functionName]
@@ -1,11 +1,19 @@
 from copy import deepcopy
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
 from random import randint
 import re
 from compiler.core.lexicalAnalyzer import LexicalAnalyzer
 from compiler.core.common.all import TokenizingRule
+from compiler.codeGenerator import CodeGenerator
+
+
+def shallowCopy(codeObject):
+    copied = object.__new__(codeObject.__class__)
+    copied.__dict__.update(codeObject.__dict__)
+    return copied
 
 
 class ShapePixel(Enum):
@@ -30,10 +38,55 @@ class Button:
     POWER = 'POWER'
 
 
-class Display:
+class Region(namedtuple('Region', ['left', 'top', 'right', 'bottom'])):
+    __slots__ = ()
+
+    @staticmethod
+    def clipped(left, top, right, bottom, W: int, H: int):
+        left, top, right, bottom = max(left, 0), max(top, 0), min(right, W), min(bottom, H)
+        if left >= right or top >= bottom:
+            return None
+        return Region(left, top, right, bottom)
+
+
+class DirtyRegionTracker:
+    def _initDirtyRegion(self, W: int, H: int):
+        self.__emptyRegion = [W, H, 0, 0]
+        self.__inkRegion = [0, 0, W, H]
+        self.__dirtyRegion = [0, 0, W, H]
+
+    @staticmethod
+    def __extendRegion(region, left, top, right, bottom):
+        if left < region[0]:
+            region[0] = left
+        if top < region[1]:
+            region[1] = top
+        if right > region[2]:
+            region[2] = right
+        if bottom > region[3]:
+            region[3] = bottom
+
+    def _markDrawn(self, left, top, right, bottom):
+        self.__extendRegion(self.__inkRegion, left, top, right, bottom)
+        self.__extendRegion(self.__dirtyRegion, left, top, right, bottom)
+
+    def _markCleared(self):
+        self.__extendRegion(self.__dirtyRegion, *self.__inkRegion)
+        self.__inkRegion = list(self.__emptyRegion)
+
+    def takeDirtyRegion(self):
+        left, top, right, bottom = self.__dirtyRegion
+        if left >= right or top >= bottom:
+            return None
+        self.__dirtyRegion = list(self.__emptyRegion)
+        return Region(left, top, right, bottom)
+
+
+class Display(DirtyRegionTracker):
     def __init__(self, pixelArray: [[bool]], W: int, H: int):
         self.__W = W
         self.__H = H
+        self._initDirtyRegion(W, H)
         self.__pixelArray = [[False]*W for _ in range(H)]
         for row in range(H):
             for column in range(W):
@@ -47,14 +100,20 @@ class Display:
         return Display([[False]*W]*H, W, H)
 
     def clear(self):
-        W = self.__W
-        H = self.__H
-        self.__pixelArray = [[False]*W for _ in range(H)]
+        clearedRow = [False] * self.__W
+        for row in self.__pixelArray:
+            row[:] = clearedRow
+        self._markCleared()
 
     def overlay(self, pixelArray: [[ShapePixel]], topLeftCoordinate=(0, 0)):
         W = self.__W
         H = self.__H
         tlX, tlY = topLeftCoordinate
+        width = max((len(row) for row in pixelArray), default=0)
+        region = Region.clipped(tlX, tlY, tlX + width, tlY + len(pixelArray), W, H)
+        if region is None:
+            return
+        self._markDrawn(*region)
         for row in range(H):
             for column in range(W):
                 overlayRow, overlayColumn = row - tlY, column - tlX
@@ -64,12 +123,18 @@ class Display:
                         pixelIsOn = shapePixel == ShapePixel.BLACK
                         self.__pixelArray[row][column] = pixelIsOn
 
+    def overlayShape(self, shape, topLeftCoordinate=(0, 0)):
+        self.overlay(shape.getShapePixelArray(), topLeftCoordinate)
+
     def isPixelOn(self, row, column):
         return self.__pixelArray[row][column]
 
     def getPixelArray(self):
         return self.__pixelArray
 
+    def getPixelBytes(self):
+        return b''.join(map(bytes, self.__pixelArray))
+
     def __repr__(self):
         onPixel = '#'
         offPixel = '.'
@@ -79,23 +144,126 @@ class Display:
         return f"{self.__class__.__name__}(\n{allRowsString}\n)"
 
 
+class DrawList:
+    def __init__(self, W: int, H: int, maxLength: int = 1024):
+        self.__W = W
+        self.__H = H
+        self.__maxLength = maxLength
+        self.__commands = []
+        self.__cleared = False
+
+    def clear(self):
+        self.__commands.clear()
+        self.__cleared = True
+
+    def addShape(self, shape, topLeftCoordinate):
+        tlX, tlY = topLeftCoordinate
+        if tlX >= self.__W or tlY >= self.__H or tlX + shape.getWidth() <= 0 or tlY + shape.getHeight() <= 0:
+            return
+        self.__commands.append((shape, topLeftCoordinate))
+
+    def isFull(self):
+        return len(self.__commands) >= self.__maxLength
+
+    def discard(self):
+        self.__commands.clear()
+        self.__cleared = False
+
+    def compositeOnto(self, display):
+        if self.__cleared:
+            display.clear()
+        for shape, topLeftCoordinate in self.__commands:
+            display.overlayShape(shape, topLeftCoordinate)
+        self.discard()
+
+
+class VariableSlots:
+    def __init__(self):
+        self.__slots = {}
+
+    def getSlot(self, varName: str) -> int:
+        slot = self.__slots.get(varName, None)
+        if slot is None:
+            slot = len(self.__slots)
+            self.__slots[varName] = slot
+        return slot
+
+    def findSlot(self, varName: str):
+        return self.__slots.get(varName, None)
+
+    def getNames(self):
+        return list(self.__slots.keys())
+
+    def createFrame(self):
+        return [0] * len(self.__slots)
+
+    def __len__(self):
+        return len(self.__slots)
+
+
+class VariablesView(Mapping):
+    def __init__(self, variableSlots: VariableSlots, variableFrame: [int]):
+        self.__variableSlots = variableSlots
+        self.__variableFrame = variableFrame
+
+    def __getitem__(self, varName):
+        slot = self.__variableSlots.findSlot(varName)
+        if slot is None:
+            raise KeyError(varName)
+        return self.__variableFrame[slot]
+
+    def __iter__(self):
+        return iter(self.__variableSlots.getNames())
+
+    def __len__(self):
+        return len(self.__variableSlots)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+@dataclass(frozen=True)
+class GameProgram:
+    states: dict
+    initialStateName: str
+    shapes: dict
+    variableSlots: VariableSlots
+
+
 class Game:
 
-    def __init__(self, states, initialStateName, shapes, W, H, fps):
-        self.__states = states
+    def __init__(self, states, initialStateName, shapes, W, H, fps, variableSlots: VariableSlots = None):
+        self.__sourceStates = states
+        self.__stateTransforms = []
+        self.__variableSlots = variableSlots if variableSlots is not None else VariableSlots()
         self.__initialStateName = initialStateName
         self.__shapes = shapes
         self.__W = W
         self.__H = H
         self.__fps = fps
+        self.__displayClass = Display
+        self.__display = None
+        self.__drawList = None
         self.__createConstants()
+        self.__createStates()
         self.reset()
 
+    @staticmethod
+    def fromProgram(program: GameProgram, W, H, fps):
+        return Game(program.states, program.initialStateName, program.shapes, W, H, fps, program.variableSlots)
+
+    def getProgram(self):
+        return GameProgram(self.__sourceStates, self.__initialStateName, self.__shapes, self.__variableSlots)
+
     def updateConstants(self, W, H, fps):
         self.__W = W
         self.__H = H
         self.__fps = fps
+        self.__display = None
+        if self.__drawList is not None:
+            self.__drawList = DrawList(W, H)
         self.__createConstants()
+        self.__createStates()
         self.reset()
 
     def getWidth(self):
@@ -110,16 +278,43 @@ class Game:
     def __createConstants(self):
         self.__constants = {'!W': self.__W, '!H': self.__H, '!FPS': self.__fps}
 
+    def __createStates(self):
+        states = self.__sourceStates
+        for stateTransform in self.__stateTransforms:
+            states = stateTransform(states, self.__constants)
+        self.__states = states
+
+    def setStateTransforms(self, stateTransforms):
+        self.__stateTransforms = list(stateTransforms)
+        self.__createStates()
+
+    @staticmethod
+    def compileStates(states, constants):
+        return {stateName: state.compile() for stateName, state in states.items()}
+
     def __currentState(self):
         return self.__states[self.__currentStateName]
 
     def reset(self):
-        self.__variables = defaultdict(int)
+        self.__variableFrame = self.__variableSlots.createFrame()
         self.__currentStateName = self.__initialStateName
-        self.__display = Display.cleared(self.__W, self.__H)
+        if self.__drawList is not None:
+            self.__drawList.discard()
+        if self.__display is None:
+            self.__display = self.__displayClass.cleared(self.__W, self.__H)
+        else:
+            self.__display.clear()
+
+    def setDisplayClass(self, displayClass):
+        self.__compositeDrawList()
+        self.__displayClass = displayClass
+        self.__display = displayClass(self.__display.getPixelArray(), self.__W, self.__H)
+
+    def _getVariableFrame(self):
+        return self.__variableFrame
 
-    def _getVariables(self):
-        return self.__variables
+    def getVariables(self):
+        return VariablesView(self.__variableSlots, self.__variableFrame)
 
     def _getConstants(self):
         return self.__constants
@@ -143,10 +338,16 @@ class Game:
         self.__currentState().run(self)
 
     def setVariable(self, varName, value: int):
-        self.__variables[varName] = value
+        slot = self.__variableSlots.getSlot(varName)
+        if slot >= len(self.__variableFrame):
+            self.__variableFrame.extend([0] * (len(self.__variableSlots) - len(self.__variableFrame)))
+        self.__variableFrame[slot] = value
 
     def getVariable(self, varName) -> int:
-        return self.__variables[varName]
+        slot = self.__variableSlots.findSlot(varName)
+        if slot is None or slot >= len(self.__variableFrame):
+            return 0
+        return self.__variableFrame[slot]
 
     def getConstant(self, constName) -> int:
         return self.__constants[constName]
@@ -154,13 +355,30 @@ class Game:
     def getShape(self, shapeName):
         return self.__shapes[shapeName]
 
+    def setDrawListEnabled(self, enabled: bool):
+        self.__compositeDrawList()
+        self.__drawList = DrawList(self.__W, self.__H) if enabled else None
+
+    def __compositeDrawList(self):
+        if self.__drawList is not None:
+            self.__drawList.compositeOnto(self.__display)
+
     def overlayShapeOnScreen(self, shape, coordinate):
-        self.__display.overlay(shape.getShapePixelArray(), coordinate)
+        if self.__drawList is None:
+            self.__display.overlayShape(shape, coordinate)
+            return
+        self.__drawList.addShape(shape, coordinate)
+        if self.__drawList.isFull():
+            self.__compositeDrawList()
 
     def clearScreen(self):
-        self.__display.clear()
+        if self.__drawList is None:
+            self.__display.clear()
+        else:
+            self.__drawList.clear()
 
     def getDisplay(self):
+        self.__compositeDrawList()
         return self.__display
 
     def jumpToState(self, targetStateName: str):
@@ -172,10 +390,51 @@ class Statement:
     def run(self, game) -> bool:
         raise Exception("`run` method not implemented")
 
+    def generateCode(self, generator: CodeGenerator):
+        raise Exception("`generateCode` method not implemented")
+
+    def optimize(self, constants):
+        return [self]
+
+    def getWrittenSlots(self):
+        return set()
+
+    def cacheInvariantExpressions(self, writtenSlots, invariantExprs):
+        return self
+
 class StatementsBlock:
     def __init__(self, statements: [Statement]):
         self.__statements = statements
 
+    def generateCode(self, generator: CodeGenerator):
+        for stmt in self.__statements:
+            stmt.generateCode(generator)
+        if len(self.__statements) == 0:
+            generator.addLine("pass")
+
+    def optimizeStatements(self, constants) -> [Statement]:
+        statements = []
+        for stmt in self.__statements:
+            statements.extend(stmt.optimize(constants))
+            if len(statements) > 0 and isinstance(statements[-1], GotoStatement):
+                break
+        return statements
+
+    def optimize(self, constants):
+        return StatementsBlock(self.optimizeStatements(constants))
+
+    def getStatements(self):
+        return self.__statements
+
+    def getWrittenSlots(self):
+        writtenSlots = set()
+        for stmt in self.__statements:
+            writtenSlots |= stmt.getWrittenSlots()
+        return writtenSlots
+
+    def cacheInvariantExpressions(self, writtenSlots, invariantExprs):
+        return StatementsBlock([stmt.cacheInvariantExpressions(writtenSlots, invariantExprs) for stmt in self.__statements])
+
     def run(self, game):
         for stmt in self.__statements:
             shouldMoveToNextStatement = stmt.run(game)
@@ -213,6 +472,59 @@ class GameState:
     def run(self, game):
         return self.__statementsBlock.run(game)
 
+    @staticmethod
+    def __compileStatementsBlock(statementsBlock: StatementsBlock, functionName: str):
+        generator = CodeGenerator()
+        statementsBlock.generateCode(generator)
+        return generator.compileFunction(functionName)
+
+    def optimize(self, constants):
+        buttonHandlers = {button: StatementsBlock(statements).optimizeStatements(constants)
+                          for button, statements in self.__buttonHandlers.items()}
+        return GameState(self.__statementsBlock.optimize(constants), buttonHandlers)
+
+    def compile(self):
+        try:
+            run = self.__compileStatementsBlock(self.__statementsBlock, 'run')
+            buttonHandlers = {button: self.__compileStatementsBlock(StatementsBlock(statements), f"on{button}Pressed")
+                              for button, statements in self.__buttonHandlers.items()}
+        except (SyntaxError, RecursionError):
+            return self
+        return CompiledGameState(run, buttonHandlers)
+
+class CompiledGameState:
+
+    def __init__(self, run, buttonHandlers):
+        self.__run = run
+        self.__buttonHandlers = buttonHandlers
+
+    def __onButtonPressed(self, game, button: Button):
+        buttonHandler = self.__buttonHandlers.get(button, None)
+        if buttonHandler is not None:
+            buttonHandler(game)
+
+    def onXPressed(self, game):
+        self.__onButtonPressed(game, Button.X)
+
+    def onYPressed(self, game):
+        self.__onButtonPressed(game, Button.Y)
+
+    def onAPressed(self, game):
+        self.__onButtonPressed(game, Button.A)
+
+    def onBPressed(self, game):
+        self.__onButtonPressed(game, Button.B)
+
+    def onStartPressed(self, game):
+        self.__onButtonPressed(game, Button.START)
+
+    def compile(self):
+        return self
+
+    def run(self, game):
+        self.__run(game)
+        return True
+
 class BinaryOperator:
 
     __precedence = defaultdict(lambda: 0, {
@@ -247,6 +559,22 @@ class BinaryOperator:
         '%': lambda a, b: a % b,
     }
 
+    __binaryOperationCode = {
+        '>=': '(1 if {0} >= {1} else 0)',
+        '<=': '(1 if {0} <= {1} else 0)',
+        '>': '(1 if {0} > {1} else 0)',
+        '<': '(1 if {0} < {1} else 0)',
+        '&': '(1 if all(({0}, {1})) else 0)',
+        '|': '(1 if any(({0}, {1})) else 0)',
+        '~=': '(1 if {0} != {1} else 0)',
+        '=': '(1 if {0} == {1} else 0)',
+        '+': '({0} + {1})',
+        '-': '({0} - {1})',
+        '*': '({0} * {1})',
+        '/': '({0} // {1})',
+        '%': '({0} % {1})',
+    }
+
     def __init__(self, opStr):
         assert opStr in self.__binaryOperationMap.keys(
         ), f"Invalid operator {opStr}"
@@ -255,6 +583,15 @@ class BinaryOperator:
     def getPrecedence(self):
         return self.__precedence[self.__opStr]
 
+    def getOperation(self):
+        return self.__binaryOperationMap[self.__opStr]
+
+    def getSymbol(self):
+        return self.__opStr
+
+    def getCode(self, operand1Code: str, operand2Code: str):
+        return self.__binaryOperationCode[self.__opStr].format(operand1Code, operand2Code)
+
     def eval(self, operand1: int, operand2: int):
         assert type(operand1) == int and type(
             operand2) == int, f"Operators should be integer, got {operand1} ({type(operand1)}) and {operand2} ({type(operand2)})"
@@ -269,14 +606,149 @@ class UnaryOperator:
         '~': lambda x: 0 if x else 1,
     }
 
+    __unaryOperationCode = {
+        '+': '(+{0})',
+        '-': '(-{0})',
+        '~': '(0 if {0} else 1)',
+    }
+
     def __init__(self, opStr):
         self.__opStr = opStr
 
+    def getOperation(self):
+        return self.__unaryOperationMap[self.__opStr]
+
+    def getCode(self, operandCode: str):
+        return self.__unaryOperationCode[self.__opStr].format(operandCode)
+
     def eval(self, operand: int):
         assert type(operand) == int, f"Operator should be integer, got {operand} ({type(operand)})"
         return self.__unaryOperationMap[self.__opStr](operand)
 
 
+class ExpressionNode:
+
+    def eval(self, game) -> int:
+        raise Exception("`eval` method not implemented")
+
+    def getCode(self) -> str:
+        raise Exception("`getCode` method not implemented")
+
+    def fold(self, constants):
+        return self
+
+    def getReadSlots(self):
+        return set()
+
+
+class LiteralNode(ExpressionNode):
+    def __init__(self, value: int):
+        self.__value = value
+
+    def eval(self, game):
+        return self.__value
+
+    def getCode(self):
+        return repr(self.__value)
+
+    def getValue(self):
+        return self.__value
+
+
+class VariableNode(ExpressionNode):
+    def __init__(self, slot: int):
+        self.__slot = slot
+
+    def eval(self, game):
+        return game._getVariableFrame()[self.__slot]
+
+    def getCode(self):
+        return f"variables[{self.__slot}]"
+
+    def getSlot(self):
+        return self.__slot
+
+    def getReadSlots(self):
+        return {self.__slot}
+
+
+class ConstantNode(ExpressionNode):
+    def __init__(self, name: str):
+        self.__name = name
+
+    def eval(self, game):
+        return game.getConstant(self.__name)
+
+    def getCode(self):
+        return f"constants[{self.__name!r}]"
+
+    def fold(self, constants):
+        if self.__name in constants:
+            return LiteralNode(constants[self.__name])
+        return self
+
+
+class UnaryOperationNode(ExpressionNode):
+    def __init__(self, operator: UnaryOperator, operand: ExpressionNode):
+        self.__operator = operator
+        self.__operation = operator.getOperation()
+        self.__operand = operand
+
+    def eval(self, game):
+        return self.__operation(self.__operand.eval(game))
+
+    def getCode(self):
+        return self.__operator.getCode(self.__operand.getCode())
+
+    def fold(self, constants):
+        operand = self.__operand.fold(constants)
+        if isinstance(operand, LiteralNode):
+            return LiteralNode(self.__operation(operand.getValue()))
+        return UnaryOperationNode(self.__operator, operand)
+
+    def getReadSlots(self):
+        return self.__operand.getReadSlots()
+
+    def __reduce__(self):
+        return (UnaryOperationNode, (self.__operator, self.__operand))
+
+
+class BinaryOperationNode(ExpressionNode):
+    def __init__(self, operator: BinaryOperator, operand1: ExpressionNode, operand2: ExpressionNode):
+        self.__operator = operator
+        self.__operation = operator.getOperation()
+        self.__operand1 = operand1
+        self.__operand2 = operand2
+
+    def eval(self, game):
+        return self.__operation(self.__operand1.eval(game), self.__operand2.eval(game))
+
+    def getCode(self):
+        return self.__operator.getCode(self.__operand1.getCode(), self.__operand2.getCode())
+
+    def fold(self, constants):
+        operand1 = self.__operand1.fold(constants)
+        operand2 = self.__operand2.fold(constants)
+        if isinstance(operand1, LiteralNode) and isinstance(operand2, LiteralNode):
+            try:
+                return LiteralNode(self.__operation(operand1.getValue(), operand2.getValue()))
+            except ZeroDivisionError:
+                pass
+        return BinaryOperationNode(self.__operator, operand1, operand2)
+
+    def getOperator(self):
+        return self.__operator
+
+    def getOperands(self):
+        return self.__operand1, self.__operand2
+
+    def getReadSlots(self):
+        return self.__operand1.getReadSlots() | self.__operand2.getReadSlots()
+
+    def __reduce__(self):
+        return (BinaryOperationNode, (self.__operator, self.__operand1, self.__operand2))
+
+
 class Expression:
     __T_LEFT_PAREN = 'left-paren'
     __T_RIGHT_PAREN = 'right-paren'
@@ -299,12 +771,18 @@ class Expression:
         re.compile(r'[ ]+')
     ]
 
-    def __init__(self, exprString, errorHandler=None):
+    def __init__(self, exprString, variableSlots: VariableSlots, errorHandler=None):
         self.__exprString = exprString
+        self.__variableSlots = variableSlots
         tokenizer = LexicalAnalyzer(
             self.__exprString[1:-1], self.__tokenizingRules, self.__ignorePatterns, generateEof=False)
         self.__tokens = list(filter(bool, tokenizer.getTokenGenerator()))
         self.__errorHandler = errorHandler
+        try:
+            self.__node = self.__compile()
+            self.__tokens = None
+        except:
+            self.__node = None
 
     def __error(self, message):
         if self.__errorHandler is not None:
@@ -312,7 +790,7 @@ class Expression:
         else:
             raise Exception(message)
 
-    def __getValue(self, game):
+    def __shuntingYard(self, getOperand, applyUnaryOperator, applyBinaryOperator):
         prevWasNumber = False
         numStack = []
         opStack = []
@@ -320,14 +798,14 @@ class Expression:
         def pushNumber(num):
             while len(opStack) > 0 and type(opStack[-1]) == UnaryOperator:
                 prevOp: UnaryOperator = opStack.pop()
-                num = prevOp.eval(num)
+                num = applyUnaryOperator(prevOp, num)
             numStack.append(num)
 
         def evalLast():
             prevOp: BinaryOperator = opStack.pop()
             b = numStack.pop()
             a = numStack.pop()
-            c = prevOp.eval(a, b)
+            c = applyBinaryOperator(prevOp, a, b)
             pushNumber(c)
 
         for tokenAndLexeme in self.__tokens:
@@ -352,22 +830,36 @@ class Expression:
                     currentOp = UnaryOperator(lexeme)
                     opStack.append(currentOp)
                 prevWasNumber = False
-            elif token == self.__T_LITERAL:
-                number = int(lexeme)
-                pushNumber(number)
-                prevWasNumber = True
-            elif token == self.__T_VARIABLE:
-                number = game.getVariable(lexeme)
-                pushNumber(number)
-                prevWasNumber = True
-            elif token == self.__T_CONSTANT:
-                number = game.getConstant(lexeme)
-                pushNumber(number)
+            elif token in (self.__T_LITERAL, self.__T_VARIABLE, self.__T_CONSTANT):
+                pushNumber(getOperand(token, lexeme))
                 prevWasNumber = True
         while len(numStack) > 1:
             evalLast()
         return numStack[0]
 
+    def __compile(self):
+        def getOperand(token, lexeme):
+            if token == self.__T_LITERAL:
+                return LiteralNode(int(lexeme))
+            elif token == self.__T_VARIABLE:
+                return VariableNode(self.__variableSlots.getSlot(lexeme))
+            return ConstantNode(lexeme)
+        return self.__shuntingYard(getOperand, UnaryOperationNode, BinaryOperationNode)
+
+    def __interpret(self, game):
+        def getOperand(token, lexeme):
+            if token == self.__T_LITERAL:
+                return int(lexeme)
+            elif token == self.__T_VARIABLE:
+                return game.getVariable(lexeme)
+            return game.getConstant(lexeme)
+        return self.__shuntingYard(getOperand, lambda op, x: op.eval(x), lambda op, a, b: op.eval(a, b))
+
+    def __getValue(self, game):
+        if self.__node is not None:
+            return self.__node.eval(game)
+        return self.__interpret(game)
+
     def getValue(self, game):
         try:
             return self.__getValue(game)
@@ -376,6 +868,49 @@ class Expression:
         except:
             self.__error(f"Invalid expression {self.__exprString}, please refer to language documentation")
 
+    def withNode(self, node: ExpressionNode):
+        expression = shallowCopy(self)
+        expression.__node = node
+        return expression
+
+    def optimize(self, constants):
+        if self.__node is None:
+            return self
+        return self.withNode(self.__node.fold(constants))
+
+    def getNode(self):
+        return self.__node
+
+    def cacheIfInvariant(self, writtenSlots, invariantExprs):
+        if not isinstance(self.__node, (UnaryOperationNode, BinaryOperationNode)):
+            return self
+        if self.__node.getReadSlots() & writtenSlots:
+            return self
+        cachedExpr = CachedExpression(self)
+        invariantExprs.append(cachedExpr)
+        return cachedExpr
+
+    def getConstantValue(self):
+        if isinstance(self.__node, LiteralNode):
+            return self.__node.getValue()
+        return None
+
+    def generateCode(self, generator: CodeGenerator) -> str:
+        if isinstance(self.__node, LiteralNode):
+            return self.__node.getCode()
+        valueName = generator.newName()
+        fallbackCode = f"{valueName} = {generator.bind(self, 'expression')}.getValue(game)"
+        if self.__node is None:
+            generator.addLine(fallbackCode)
+            return valueName
+        generator.addLine("try:")
+        with generator.indented():
+            generator.addLine(f"{valueName} = {self.__node.getCode()}")
+        generator.addLine("except Exception:")
+        with generator.indented():
+            generator.addLine(fallbackCode)
+        return valueName
+
 
 class RandomExpression(Expression):
     def __init__(self, expr1, expr2):
@@ -387,17 +922,95 @@ class RandomExpression(Expression):
                       self.__expr2.getValue(game)])
         return randint(m, M)
 
+    def optimize(self, constants):
+        return RandomExpression(self.__expr1.optimize(constants), self.__expr2.optimize(constants))
+
+    def getNode(self):
+        return None
+
+    def cacheIfInvariant(self, writtenSlots, invariantExprs):
+        return RandomExpression(self.__expr1.cacheIfInvariant(writtenSlots, invariantExprs),
+                                self.__expr2.cacheIfInvariant(writtenSlots, invariantExprs))
+
+    def getConstantValue(self):
+        return None
+
+    def generateCode(self, generator: CodeGenerator) -> str:
+        value1Name = self.__expr1.generateCode(generator)
+        value2Name = self.__expr2.generateCode(generator)
+        valueName = generator.newName()
+        generator.addLine(f"{valueName} = {generator.bind(randint, 'randint')}(*sorted([{value1Name}, {value2Name}]))")
+        return valueName
+
+
+class CachedExpression(Expression):
+    def __init__(self, expr: Expression):
+        self.__expr = expr
+        self.__value = None
+
+    def invalidate(self):
+        self.__value = None
+
+    def getValue(self, game):
+        if self.__value is None:
+            self.__value = self.__expr.getValue(game)
+        return self.__value
+
+    def getNode(self):
+        return None
+
+    def cacheIfInvariant(self, writtenSlots, invariantExprs):
+        return self
+
+    def getConstantValue(self):
+        return None
+
+    def generateInvalidation(self, generator: CodeGenerator):
+        generator.addLine(f"{generator.getLocalName(self, 'cached')} = None")
+
+    def generateCode(self, generator: CodeGenerator) -> str:
+        cacheName = generator.getLocalName(self, 'cached')
+        generator.addLine(f"if {cacheName} is None:")
+        with generator.indented():
+            valueName = self.__expr.generateCode(generator)
+            generator.addLine(f"{cacheName} = {valueName}")
+        return cacheName
+
 
 class VariableUpdateStatement(Statement):
 
-    def __init__(self, name: str, expr: Expression):
+    def __init__(self, name: str, expr: Expression, variableSlots: VariableSlots):
         self.__name = name
+        self.__slot = variableSlots.getSlot(name)
         self.__expr = expr
 
     def run(self, game):
-        game.setVariable(self.__name, self.__expr.getValue(game))
+        game._getVariableFrame()[self.__slot] = self.__expr.getValue(game)
         return True
 
+    def generateCode(self, generator: CodeGenerator):
+        valueName = self.__expr.generateCode(generator)
+        generator.addLine(f"variables[{self.__slot}] = {valueName}")
+
+    def optimize(self, constants):
+        optimized = shallowCopy(self)
+        optimized.__expr = self.__expr.optimize(constants)
+        return [optimized]
+
+    def getSlot(self):
+        return self.__slot
+
+    def getExpression(self):
+        return self.__expr
+
+    def getWrittenSlots(self):
+        return {self.__slot}
+
+    def cacheInvariantExpressions(self, writtenSlots, invariantExprs):
+        optimized = shallowCopy(self)
+        optimized.__expr = self.__expr.cacheIfInvariant(writtenSlots, invariantExprs)
+        return optimized
+
 
 class SelectionStatement(Statement):
 
@@ -408,47 +1021,228 @@ class SelectionStatement(Statement):
     def _conditionIsTrue(self, game):
         raise Exception("_conditionIsTrue method not implemented")
 
+    def _getConditionCode(self, valueName: str):
+        raise Exception("_getConditionCode method not implemented")
+
+    def _conditionHoldsFor(self, value: int):
+        raise Exception("_conditionHoldsFor method not implemented")
+
     def run(self, game):
         if self._conditionIsTrue(game):
             return self._statementsBlock.run(game)
         return True
 
+    def generateCode(self, generator: CodeGenerator):
+        valueName = self._conditionExpr.generateCode(generator)
+        generator.addLine(f"if {self._getConditionCode(valueName)}:")
+        with generator.indented():
+            self._statementsBlock.generateCode(generator)
+
+    def optimize(self, constants):
+        conditionExpr = self._conditionExpr.optimize(constants)
+        conditionValue = conditionExpr.getConstantValue()
+        if conditionValue is not None:
+            return self._statementsBlock.optimizeStatements(constants) if self._conditionHoldsFor(conditionValue) else []
+        return [self.__class__(conditionExpr, self._statementsBlock.optimize(constants))]
+
+    def getWrittenSlots(self):
+        return self._statementsBlock.getWrittenSlots()
+
+    def cacheInvariantExpressions(self, writtenSlots, invariantExprs):
+        return self.__class__(self._conditionExpr.cacheIfInvariant(writtenSlots, invariantExprs),
+                              self._statementsBlock.cacheInvariantExpressions(writtenSlots, invariantExprs))
+
 
 class IfStatement(SelectionStatement):
     def _conditionIsTrue(self, game):
         return self._conditionExpr.getValue(game) != 0
 
+    def _getConditionCode(self, valueName: str):
+        return f"{valueName} != 0"
+
+    def _conditionHoldsFor(self, value: int):
+        return value != 0
+
 
 class IfNotStatement(SelectionStatement):
     def _conditionIsTrue(self, game):
         return self._conditionExpr.getValue(game) == 0
 
+    def _getConditionCode(self, valueName: str):
+        return f"{valueName} == 0"
+
+    def _conditionHoldsFor(self, value: int):
+        return value == 0
+
 class IterationStatement(Statement):
 
-    def __init__(self, conditionExpr: Expression, statementsBlock: StatementsBlock):
+    def __init__(self, conditionExpr: Expression, statementsBlock: StatementsBlock, invariantExprs: [CachedExpression] = ()):
         self._conditionExpr = conditionExpr
         self._statementsBlock = statementsBlock
+        self._invariantExprs = invariantExprs
 
     def _conditionIsTrue(self, game):
         raise Exception("_conditionIsTrue method not implemented")
 
+    def _getConditionCode(self, valueName: str):
+        raise Exception("_getConditionCode method not implemented")
+
+    def _conditionHoldsFor(self, value: int):
+        raise Exception("_conditionHoldsFor method not implemented")
+
+    def _invalidateInvariantExpressions(self):
+        for invariantExpr in self._invariantExprs:
+            invariantExpr.invalidate()
+
+    def _generateInvariantExpressionsInvalidation(self, generator: CodeGenerator):
+        for invariantExpr in self._invariantExprs:
+            invariantExpr.generateInvalidation(generator)
+
     def run(self, game):
+        self._invalidateInvariantExpressions()
         while self._conditionIsTrue(game):
             shouldMoveToNextIteration = self._statementsBlock.run(game)
             if not shouldMoveToNextIteration:
                 return False
         return True
 
+    def generateCode(self, generator: CodeGenerator):
+        self._generateInvariantExpressionsInvalidation(generator)
+        generator.addLine("while True:")
+        with generator.indented():
+            valueName = self._conditionExpr.generateCode(generator)
+            generator.addLine(f"if not ({self._getConditionCode(valueName)}):")
+            with generator.indented():
+                generator.addLine("break")
+            self._statementsBlock.generateCode(generator)
+
+    def optimize(self, constants):
+        conditionExpr = self._conditionExpr.optimize(constants)
+        conditionValue = conditionExpr.getConstantValue()
+        if conditionValue is not None and not self._conditionHoldsFor(conditionValue):
+            return []
+        statementsBlock = self._statementsBlock.optimize(constants)
+        invariantExprs = []
+        statementsBlock = statementsBlock.cacheInvariantExpressions(statementsBlock.getWrittenSlots(), invariantExprs)
+        loop = self.__class__(conditionExpr, statementsBlock, invariantExprs)
+        countedLoop = CountedLoopStatement.fromLoop(loop)
+        return [countedLoop if countedLoop is not None else loop]
+
+    def getWrittenSlots(self):
+        return self._statementsBlock.getWrittenSlots()
+
 
 class WhileStatement(IterationStatement):
     def _conditionIsTrue(self, game):
         return self._conditionExpr.getValue(game) != 0
 
+    def _getConditionCode(self, valueName: str):
+        return f"{valueName} != 0"
+
+    def _conditionHoldsFor(self, value: int):
+        return value != 0
+
 
 class WhileNotStatement(IterationStatement):
     def _conditionIsTrue(self, game):
         return self._conditionExpr.getValue(game) == 0
 
+    def _getConditionCode(self, valueName: str):
+        return f"{valueName} == 0"
+
+    def _conditionHoldsFor(self, value: int):
+        return value == 0
+
+
+class CountedLoopStatement(Statement):
+    __comparisons = {
+        '<': (1, 0),
+        '<=': (1, 1),
+        '>': (-1, 0),
+        '>=': (-1, -1),
+    }
+
+    def __init__(self, loop: IterationStatement, slot: int, boundExpr: Expression, boundOffset: int, step: int, statementsBlock: StatementsBlock):
+        self.__loop = loop
+        self.__slot = slot
+        self.__boundExpr = boundExpr
+        self.__boundOffset = boundOffset
+        self.__step = step
+        self.__statementsBlock = statementsBlock
+
+    @staticmethod
+    def __getStep(expr: Expression, slot: int):
+        node = expr.getNode()
+        if not isinstance(node, BinaryOperationNode):
+            return None
+        operand1, operand2 = node.getOperands()
+        symbol = node.getOperator().getSymbol()
+        def isCounter(operand): return isinstance(operand, VariableNode) and operand.getSlot() == slot
+        if symbol == '+' and isCounter(operand1) and isinstance(operand2, LiteralNode):
+            return operand2.getValue()
+        if symbol == '+' and isCounter(operand2) and isinstance(operand1, LiteralNode):
+            return operand1.getValue()
+        if symbol == '-' and isCounter(operand1) and isinstance(operand2, LiteralNode):
+            return -operand2.getValue()
+        return None
+
+    @staticmethod
+    def fromLoop(loop: IterationStatement):
+        if type(loop) != WhileStatement:
+            return None
+        conditionNode = loop._conditionExpr.getNode()
+        if not isinstance(conditionNode, BinaryOperationNode):
+            return None
+        comparison = CountedLoopStatement.__comparisons.get(conditionNode.getOperator().getSymbol(), None)
+        counterNode, boundNode = conditionNode.getOperands()
+        if comparison is None or not isinstance(counterNode, VariableNode):
+            return None
+        slot = counterNode.getSlot()
+        statements = loop._statementsBlock.getStatements()
+        if len(statements) == 0 or not isinstance(statements[-1], VariableUpdateStatement) or statements[-1].getSlot() != slot:
+            return None
+        step = CountedLoopStatement.__getStep(statements[-1].getExpression(), slot)
+        direction, boundOffset = comparison
+        if step is None or step * direction <= 0:
+            return None
+        statementsBlock = StatementsBlock(statements[:-1])
+        if slot in statementsBlock.getWrittenSlots() or boundNode.getReadSlots() & loop.getWrittenSlots():
+            return None
+        return CountedLoopStatement(loop, slot, loop._conditionExpr.withNode(boundNode), boundOffset, step, statementsBlock)
+
+    def getWrittenSlots(self):
+        return self.__loop.getWrittenSlots()
+
+    def run(self, game):
+        variableFrame = game._getVariableFrame()
+        start = variableFrame[self.__slot]
+        bound = self.__boundExpr.getValue(game)
+        if type(start) != int or type(bound) != int:
+            return self.__loop.run(game)
+        self.__loop._invalidateInvariantExpressions()
+        step = self.__step
+        for value in range(start, bound + self.__boundOffset, step):
+            if not self.__statementsBlock.run(game):
+                return False
+            variableFrame[self.__slot] = value + step
+        return True
+
+    def generateCode(self, generator: CodeGenerator):
+        startName = generator.newName()
+        generator.addLine(f"{startName} = variables[{self.__slot}]")
+        boundName = self.__boundExpr.generateCode(generator)
+        generator.addLine(f"if type({startName}) is int and type({boundName}) is int:")
+        with generator.indented():
+            self.__loop._generateInvariantExpressionsInvalidation(generator)
+            counterName = generator.newName('counter')
+            generator.addLine(f"for {counterName} in range({startName}, {boundName} + {self.__boundOffset}, {self.__step}):")
+            with generator.indented():
+                self.__statementsBlock.generateCode(generator)
+                generator.addLine(f"variables[{self.__slot}] = {counterName} + {self.__step}")
+        generator.addLine(f"elif not {generator.bind(self.__loop, 'loop')}.run(game):")
+        with generator.indented():
+            generator.addLine("return")
+
 
 class ScreenUpdateStatement(Statement):
 
@@ -468,6 +1262,9 @@ class ClearScreenStatement(ScreenUpdateStatement):
         self._clear(game)
         return True
 
+    def generateCode(self, generator: CodeGenerator):
+        generator.addLine("game.clearScreen()")
+
 
 class DisplayShapeStatement(ScreenUpdateStatement):
     def __init__(self, shapeName: str, xPosExpr: Expression, yPosExpr: Expression):
@@ -481,6 +1278,23 @@ class DisplayShapeStatement(ScreenUpdateStatement):
         self._overlay(game, self.__shapeName, coordinate)
         return True
 
+    def generateCode(self, generator: CodeGenerator):
+        xPosName = self.__xPosExpr.generateCode(generator)
+        yPosName = self.__yPosExpr.generateCode(generator)
+        generator.addLine(f"game.overlayShapeOnScreen(game.getShape({self.__shapeName!r}), ({xPosName}, {yPosName}))")
+
+    def optimize(self, constants):
+        optimized = shallowCopy(self)
+        optimized.__xPosExpr = self.__xPosExpr.optimize(constants)
+        optimized.__yPosExpr = self.__yPosExpr.optimize(constants)
+        return [optimized]
+
+    def cacheInvariantExpressions(self, writtenSlots, invariantExprs):
+        optimized = shallowCopy(self)
+        optimized.__xPosExpr = self.__xPosExpr.cacheIfInvariant(writtenSlots, invariantExprs)
+        optimized.__yPosExpr = self.__yPosExpr.cacheIfInvariant(writtenSlots, invariantExprs)
+        return optimized
+
 
 class GotoStatement(Statement):
     def __init__(self, targetStateName: str):
@@ -490,10 +1304,16 @@ class GotoStatement(Statement):
         game.jumpToState(self.__targetStateName)
         return False
 
+    def generateCode(self, generator: CodeGenerator):
+        generator.addLine(f"game.jumpToState({self.__targetStateName!r})")
+        generator.addLine("return")
+
 
 class Shape:
     def __init__(self, pixelArray: [[ShapePixel]]):
         self.__pixelArray = deepcopy(pixelArray)
+        self.__width = max((len(row) for row in pixelArray), default=0)
+        self.__height = len(pixelArray)
 
     @staticmethod
     def fromShapeString(shapeString: str):
@@ -504,6 +1324,12 @@ class Shape:
     def getShapePixelArray(self):
         return self.__pixelArray
 
+    def getWidth(self):
+        return self.__width
+
+    def getHeight(self):
+        return self.__height
+
     def __repr__(self):
         def getPixelChar(pixel): {ShapePixel.TRANSPARENT: ' ',
                                   ShapePixel.WHITE: '.', ShapePixel.BLACK: '#'}[pixel]
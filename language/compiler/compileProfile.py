@@ -0,0 +1,109 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+
+NOT_MEASURED = 'n/a'
+
+
+@dataclass
+class PhaseProfile:
+    name: str
+    seconds: float = 0.0
+    peakAllocatedBytes: int = None
+    counters: dict = field(default_factory=dict)
+    parts: dict = field(default_factory=dict)
+
+
+class PartTimer:
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+
+    def timeFunction(self, function):
+        def timedFunction(*args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                self.seconds += time.perf_counter() - start
+                self.calls += 1
+        return timedFunction
+
+    def timeIterator(self, iterable):
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.seconds += time.perf_counter() - start
+                self.calls += 1
+            yield item
+
+
+class CompileProfile:
+
+    def __init__(self, traceMemory=False):
+        self.phases: [PhaseProfile] = []
+        self.__traceMemory = traceMemory
+        self.__currentPhase = None
+
+    def isTracingMemory(self):
+        return self.__traceMemory
+
+    @contextmanager
+    def phase(self, name: str):
+        phaseProfile = PhaseProfile(name)
+        self.phases.append(phaseProfile)
+        previousPhase, self.__currentPhase = self.__currentPhase, phaseProfile
+        startedTracing = self.__traceMemory and not tracemalloc.is_tracing()
+        if startedTracing:
+            tracemalloc.start()
+        elif self.__traceMemory and hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        allocatedBefore = tracemalloc.get_traced_memory()[0] if self.__traceMemory else 0
+        start = time.perf_counter()
+        try:
+            yield phaseProfile
+        finally:
+            phaseProfile.seconds = time.perf_counter() - start
+            if self.__traceMemory:
+                phaseProfile.peakAllocatedBytes = max(0, tracemalloc.get_traced_memory()[1] - allocatedBefore)
+            if startedTracing:
+                tracemalloc.stop()
+            self.__currentPhase = previousPhase
+
+    def addCounters(self, **counters):
+        if self.__currentPhase is not None:
+            self.__currentPhase.counters.update(counters)
+
+    def getPhase(self, name: str):
+        for phaseProfile in self.phases:
+            if phaseProfile.name == name:
+                return phaseProfile
+        return None
+
+    def getTotalSeconds(self):
+        return sum(phaseProfile.seconds for phaseProfile in self.phases)
+
+    def toDict(self):
+        return {'phases': [asdict(phaseProfile) for phaseProfile in self.phases], 'seconds': self.getTotalSeconds(),
+                'memoryTraced': self.__traceMemory}
+
+    def __str__(self):
+        def formatValue(value): return NOT_MEASURED if value is None else value
+        lines = [f"{'Phase':<20}{'Time (ms)':>12}{'Peak (KiB)':>14}  Counters"]
+        for phaseProfile in self.phases:
+            peak = NOT_MEASURED if phaseProfile.peakAllocatedBytes is None else f"{phaseProfile.peakAllocatedBytes / 1024:.1f}"
+            counters = ', '.join(f"{name}={formatValue(value)}" for name, value in phaseProfile.counters.items())
+            lines.append(f"{phaseProfile.name:<20}{phaseProfile.seconds * 1000:>12.2f}{peak:>14}  {counters}")
+            for partName, seconds in phaseProfile.parts.items():
+                lines.append(f"{'  ' + partName:<20}{seconds * 1000:>12.2f}")
+        lines.append(f"{'total':<20}{self.getTotalSeconds() * 1000:>12.2f}")
+        if self.__traceMemory:
+            lines.append("Times were measured with tracemalloc running and include its overhead; profile without memory tracing for exact times.")
+        return '\n'.join(lines)
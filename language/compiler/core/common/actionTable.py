@@ -74,3 +74,12 @@ class ActionTable:
             raise Exception(f"Accept-reduce conflict at state '{state}' and terminal '{terminal}'")
         else:
             self.__acceptTable[state][terminal] = Action.accept()
+
+    def getShiftEntries(self):
+        return [(state, terminal, action.toState) for state, row in self.__shiftTable.items() for terminal, action in row.items()]
+
+    def getReduceEntries(self):
+        return [(state, action.ruleNumber) for state, action in self.__reduceTable.items()]
+
+    def getAcceptEntries(self):
+        return [(state, terminal) for state, row in self.__acceptTable.items() for terminal in row.keys()]
@@ -1,4 +1,5 @@
 from compiler.core.common.tokenizingRule import TokenizingRule
+from compiler.core.common.masterPattern import MasterPattern
 from compiler.core.common.tokenAndLexeme import TokenAndLexeme, CharPosition
 from compiler.core.common.rhsSymbol import RhsSymbol
 from compiler.core.common.grammarRuleRhs import GrammarRuleRhs
@@ -6,5 +7,6 @@ from compiler.core.common.grammar import Grammar
 from compiler.core.common.action import Action
 from compiler.core.common.actionTable import ActionTable
 from compiler.core.common.gotoTable import GotoTable
+from compiler.core.common.denseParseTable import DenseParseTable
 from compiler.core.common.item import Item
 from compiler.core.common.itemSet import ItemSet
@@ -0,0 +1,84 @@
+from array import array
+from compiler.core.common.actionTable import ActionTable
+from compiler.core.common.gotoTable import GotoTable
+
+
+class DenseParseTable:
+    ERROR = 0
+    ACCEPT = -1
+
+    def __init__(self, actionTable: ActionTable, gotoTable: GotoTable, ruleLhs: [str], ruleLengths: [int]):
+        shiftEntries = actionTable.getShiftEntries()
+        acceptEntries = actionTable.getAcceptEntries()
+        reduceEntries = actionTable.getReduceEntries()
+        gotoEntries = gotoTable.getGotoEntries()
+
+        self.terminals = self.__getOrderedSymbols([terminal for _, terminal, _ in shiftEntries] + [terminal for _, terminal in acceptEntries])
+        self.nonTerminals = self.__getOrderedSymbols(list(ruleLhs) + [nonTerminal for _, nonTerminal, _ in gotoEntries])
+        self.terminalIds = {terminal: terminalId for terminalId, terminal in enumerate(self.terminals)}
+        self.nonTerminalIds = {nonTerminal: nonTerminalId for nonTerminalId, nonTerminal in enumerate(self.nonTerminals)}
+        self.unknownTerminalId = len(self.terminals)
+        self.actionRowWidth = len(self.terminals) + 1
+        self.gotoRowWidth = len(self.nonTerminals)
+
+        states = [state for state, _, _ in shiftEntries] + [state for state, _, _ in gotoEntries]
+        states += [state for state, _ in acceptEntries] + [state for state, _ in reduceEntries]
+        self.numberOfStates = max(states) + 1
+        typeCode = self.__getTypeCode(max(self.numberOfStates, len(ruleLengths)) + 2)
+
+        actions = [self.ERROR] * (self.numberOfStates * self.actionRowWidth)
+        for state, terminal, toState in shiftEntries:
+            actions[state * self.actionRowWidth + self.terminalIds[terminal]] = self.encodeShift(toState)
+        for state, terminal in acceptEntries:
+            actions[state * self.actionRowWidth + self.terminalIds[terminal]] = self.ACCEPT
+        for state, ruleNumber in reduceEntries:
+            rowStart = state * self.actionRowWidth
+            actions[rowStart: rowStart + self.actionRowWidth] = [self.encodeReduce(ruleNumber)] * self.actionRowWidth
+        self.actions = array(typeCode, actions)
+
+        gotos = [self.ERROR] * (self.numberOfStates * self.gotoRowWidth)
+        for state, nonTerminal, toState in gotoEntries:
+            gotos[state * self.gotoRowWidth + self.nonTerminalIds[nonTerminal]] = self.encodeShift(toState)
+        self.gotos = array(typeCode, gotos)
+
+        self.ruleLhsIds = array(typeCode, [self.nonTerminalIds[lhs] for lhs in ruleLhs])
+        self.ruleLengths = array(typeCode, ruleLengths)
+
+    @staticmethod
+    def __getOrderedSymbols(symbols: [str]):
+        return list(dict.fromkeys(symbols))
+
+    @staticmethod
+    def __getTypeCode(maximumMagnitude: int):
+        for typeCode in ['b', 'h', 'i', 'l', 'q']:
+            if maximumMagnitude < 2 ** (array(typeCode).itemsize * 8 - 1):
+                return typeCode
+        raise Exception("Parse table is too large to be encoded")
+
+    @staticmethod
+    def encodeShift(toState: int):
+        return toState + 1
+
+    @staticmethod
+    def decodeShift(action: int):
+        return action - 1
+
+    @staticmethod
+    def encodeReduce(ruleNumber: int):
+        return -ruleNumber - 2
+
+    @staticmethod
+    def decodeReduce(action: int):
+        return -action - 2
+
+    def getTerminalId(self, terminal: str):
+        return self.terminalIds.get(terminal, self.unknownTerminalId)
+
+    def getAction(self, state: int, terminalId: int):
+        return self.actions[state * self.actionRowWidth + terminalId]
+
+    def getStateToGoTo(self, state: int, nonTerminalId: int):
+        action = self.gotos[state * self.gotoRowWidth + nonTerminalId]
+        if action == self.ERROR:
+            raise Exception(f"No goto specified for state '{state}' and non-terminal '{self.nonTerminals[nonTerminalId]}'")
+        return self.decodeShift(action)
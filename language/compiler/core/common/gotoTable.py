@@ -16,3 +16,6 @@ class GotoTable:
             return self.__gotoTable[state][nonTerminal]
         else:
             raise Exception(f"No goto specified for state '{state}' and non-terminal '{nonTerminal}'")
+
+    def getGotoEntries(self):
+        return [(state, nonTerminal, toState) for state, row in self.__gotoTable.items() for nonTerminal, toState in row.items()]
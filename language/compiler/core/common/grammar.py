@@ -1,3 +1,4 @@
+import hashlib
 from compiler.core.common.rhsSymbol import RhsSymbol
 from compiler.core.common.grammarRuleRhs import GrammarRuleRhs
 
@@ -30,5 +31,8 @@ class Grammar:
         maxLhsLength = max(map(len, self.__rules.keys()))
         return '\n'.join(map(lambda lhs: self.__getStringFromGrammarRule(lhs, self.__rules[lhs], maxLhsLength), self.__rules.keys()))
 
+    def getHash(self):
+        return hashlib.sha256(self.getGrammarString().encode('utf-8')).hexdigest()
+
     def __eq__(self, other):
         return self.__rules == other._Grammar__rules
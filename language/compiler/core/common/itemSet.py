@@ -20,4 +20,4 @@ class ItemSet:
         return itemsEqual
 
     def __hash__(self):
-        return hash(tuple(self.__items))
+        return hash(frozenset(self.__items))
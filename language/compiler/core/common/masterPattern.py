@@ -0,0 +1,55 @@
+import re
+from re import Pattern
+
+
+class MasterPattern:
+    __cache = {}
+    __numberedBackreferencePattern = re.compile(r"\\(?:[1-9]|g<\d)")
+
+    def __init__(self, patterns: [Pattern]):
+        self.__patterns = list(patterns)
+        self.__combinedPattern = None
+        self.__patternIndexFromGroupIndex = {}
+        if self.__canBeCombined():
+            self.__combine()
+
+    @staticmethod
+    def fromPatterns(patterns: [Pattern]):
+        key = tuple(patterns)
+        masterPattern = MasterPattern.__cache.get(key, None)
+        if masterPattern is None:
+            masterPattern = MasterPattern(key)
+            MasterPattern.__cache[key] = masterPattern
+        return masterPattern
+
+    def __canBeCombined(self):
+        if len(self.__patterns) == 0:
+            return False
+        flags = self.__patterns[0].flags
+        for pattern in self.__patterns:
+            if pattern.flags != flags or len(pattern.groupindex) > 0:
+                return False
+            if self.__numberedBackreferencePattern.search(pattern.pattern) is not None:
+                return False
+        return True
+
+    def __combine(self):
+        alternatives = []
+        groupIndex = 1
+        for patternIndex, pattern in enumerate(self.__patterns):
+            alternatives.append(f"({pattern.pattern})")
+            self.__patternIndexFromGroupIndex[groupIndex] = patternIndex
+            groupIndex += 1 + pattern.groups
+        self.__combinedPattern = re.compile('|'.join(alternatives), self.__patterns[0].flags)
+
+    def match(self, data: str, position: int):
+        if self.__combinedPattern is not None:
+            match = self.__combinedPattern.match(data, position)
+            if match is not None:
+                return self.__patternIndexFromGroupIndex[match.lastindex], match.group()
+        else:
+            for patternIndex, pattern in enumerate(self.__patterns):
+                match = pattern.match(data, position)
+                if match is not None:
+                    return patternIndex, match.group()
+        return None
@@ -1,6 +1,7 @@
 import re
+from bisect import bisect_right
 from re import Pattern
-from compiler.core.common.all import TokenizingRule, TokenAndLexeme, CharPosition, RhsSymbol
+from compiler.core.common.all import TokenizingRule, MasterPattern, TokenAndLexeme, CharPosition, RhsSymbol
 
 
 class LexicalAnalyzer:
@@ -8,18 +9,21 @@ class LexicalAnalyzer:
 
     def __init__(self, data: str, rules: [TokenizingRule], ignorePatterns: [Pattern] = [], generateEof=True, errorHandler=None):
         self.__rules = rules
-        self.__ignorePatterns = ignorePatterns
+        self.__rulesPattern = MasterPattern.fromPatterns([rule.pattern for rule in rules])
+        self.__ignorePattern = MasterPattern.fromPatterns(ignorePatterns)
         self.__originalData = data
-        self.__remainingData = data
+        self.__position = 0
+        self.__dataFinished = False
         self.__generateEof = generateEof
         self.__errorHandler = errorHandler
+        self.__lineStartIndices = self.__getLineStartIndices(data)
         self.__eofTokenAndLexeme = TokenAndLexeme(RhsSymbol.eof().value, '', self.__getCharPositionFromCharIndex(len(self.__originalData)))
 
     def reachedEndOfData(self):
-        return len(self.__remainingData) == 0
+        return self.__position >= len(self.__originalData)
 
     def isDataFinished(self):
-        return self.__remainingData is None
+        return self.__dataFinished
 
     def __error(self, message):
         if self.__errorHandler is not None:
@@ -27,54 +31,43 @@ class LexicalAnalyzer:
         else:
             raise Exception(message)
 
+    def __getLineStartIndices(self, data: str):
+        lineStartIndices = [0]
+        newLineIndex = data.find(self.__newLineChar)
+        while newLineIndex != -1:
+            lineStartIndices.append(newLineIndex + 1)
+            newLineIndex = data.find(self.__newLineChar, newLineIndex + 1)
+        return lineStartIndices
+
     def __getCharPositionFromCharIndex(self, charIndex: int):
-        lineNumber = 1
-        columnNumber = 1
-        totalCharsCounted = 0
-        while(totalCharsCounted < charIndex):
-            currentChar = self.__originalData[totalCharsCounted]
-            if currentChar == self.__newLineChar:
-                lineNumber += 1
-                columnNumber = 1
-            else:
-                columnNumber += 1
-            totalCharsCounted += 1
-        return CharPosition(lineNumber, columnNumber)
+        lineIndex = bisect_right(self.__lineStartIndices, charIndex) - 1
+        return CharPosition(lineIndex + 1, charIndex - self.__lineStartIndices[lineIndex] + 1)
 
     def __unexpectedTokenError(self, charIndex: int):
         lineNumber, columnNumber = self.__getCharPositionFromCharIndex(charIndex)
         self.__error(f"Unexpected token {self.__originalData[charIndex: charIndex+3]}... at {lineNumber}:{columnNumber}")
 
-    def __getLexemeFromRule(self, rule: TokenizingRule) -> str:
-        return self.__getPrefixMatchFromPattern(rule.pattern)
-
-    def __getPrefixMatchFromPattern(self, pattern: Pattern) -> str:
-        prefixMatch = pattern.match(self.__remainingData)
-        if prefixMatch is not None:
-            return prefixMatch.group()
-
     def __skipIgnorablePrefix(self):
         ignorablePrefixExists = True
         while(ignorablePrefixExists):
-            ignorablePrefixExists = False
-            for pattern in self.__ignorePatterns:
-                ignoreString = self.__getPrefixMatchFromPattern(pattern)
-                if ignoreString is not None:
-                    self.__remainingData = self.__remainingData[len(ignoreString):]
-                    ignorablePrefixExists = True
+            ignoreMatch = self.__ignorePattern.match(self.__originalData, self.__position)
+            ignorablePrefixExists = ignoreMatch is not None
+            if ignorablePrefixExists:
+                _, ignoreString = ignoreMatch
+                self.__position += len(ignoreString)
 
     def __getPrefixTokenAndLexeme(self) -> TokenAndLexeme:
         if not self.isDataFinished():
             if not self.reachedEndOfData():
-                for rule in self.__rules:
-                    lexeme = self.__getLexemeFromRule(rule)
-                    if lexeme is not None:
-                        position = self.__getCharPositionFromCharIndex(len(self.__originalData) - len(self.__remainingData))
-                        self.__remainingData = self.__remainingData[len(lexeme):]
-                        return TokenAndLexeme(rule.token, lexeme, position)
-                self.__unexpectedTokenError(len(self.__originalData) - len(self.__remainingData))
+                ruleMatch = self.__rulesPattern.match(self.__originalData, self.__position)
+                if ruleMatch is not None:
+                    ruleIndex, lexeme = ruleMatch
+                    position = self.__getCharPositionFromCharIndex(self.__position)
+                    self.__position += len(lexeme)
+                    return TokenAndLexeme(self.__rules[ruleIndex].token, lexeme, position)
+                self.__unexpectedTokenError(self.__position)
             else:
-                self.__remainingData = None
+                self.__dataFinished = True
                 if self.__generateEof:
                     return self.__eofTokenAndLexeme
 
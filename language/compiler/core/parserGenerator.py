@@ -0,0 +1,120 @@
+from compiler.core.common.all import Grammar, DenseParseTable
+from compiler.core.syntaxAnalyzer import SyntaxAnalyzer
+
+
+class ParserGenerator:
+    __indent = '    '
+    __stateFunctionParameters = 'tokenAndLexeme, states, values, makeTerminal, makeNonTerminal'
+
+    def __init__(self, grammar: Grammar, startSymbol: str, errorHandler=None, tableCache=None):
+        self.__grammar = grammar
+        self.__startSymbol = startSymbol
+        self.__table = SyntaxAnalyzer(grammar, startSymbol, None, errorHandler=errorHandler, tableCache=tableCache).getDenseParseTable()
+
+    def __getGotoTableName(self, nonTerminalId: int):
+        return f"GOTO_{nonTerminalId}"
+
+    def __getStateFunctionName(self, state: int):
+        return f"state{state}"
+
+    def __getRow(self, state: int):
+        rowStart = state * self.__table.actionRowWidth
+        return self.__table.actions[rowStart: rowStart + self.__table.actionRowWidth]
+
+    def __getGotoTableLines(self):
+        table = self.__table
+        lines = []
+        for nonTerminalId, nonTerminal in enumerate(table.nonTerminals):
+            gotos = {}
+            for state in range(table.numberOfStates):
+                action = table.gotos[state * table.gotoRowWidth + nonTerminalId]
+                if action != DenseParseTable.ERROR:
+                    gotos[state] = DenseParseTable.decodeShift(action)
+            lines.append(f"# {nonTerminal}")
+            lines.append(f"{self.__getGotoTableName(nonTerminalId)} = {gotos!r}")
+        return lines
+
+    def __getReduceStateBody(self, ruleNumber: int):
+        table = self.__table
+        lhsId = table.ruleLhsIds[ruleNumber]
+        numberOfSymbols = table.ruleLengths[ruleNumber]
+        return [
+            f"children = values[-{numberOfSymbols}:]",
+            f"del values[-{numberOfSymbols}:]",
+            f"del states[-{numberOfSymbols}:]",
+            f"values.append(makeNonTerminal({ruleNumber}, {table.nonTerminals[lhsId]!r}, children))",
+            f"states.append({self.__getGotoTableName(lhsId)}[states[-1]])",
+            "return REDUCED",
+        ]
+
+    def __getShiftStateBody(self, state: int, row):
+        table = self.__table
+        body = ["token = tokenAndLexeme.token"]
+        for terminalId, terminal in enumerate(table.terminals):
+            action = row[terminalId]
+            if action == DenseParseTable.ACCEPT:
+                body += [f"if token == {terminal!r}:", f"{self.__indent}return ACCEPTED"]
+            elif action > 0:
+                body += [
+                    f"if token == {terminal!r}:",
+                    f"{self.__indent}values.append(makeTerminal(tokenAndLexeme))",
+                    f"{self.__indent}states.append({DenseParseTable.decodeShift(action)})",
+                    f"{self.__indent}return SHIFTED",
+                ]
+        body.append(f"raise Exception(f\"No action specified for state '{state}' and terminal '{{token}}'\")")
+        return body
+
+    def __getStateFunctionLines(self, state: int):
+        row = self.__getRow(state)
+        action = row[self.__table.unknownTerminalId]
+        if action < DenseParseTable.ACCEPT:
+            body = self.__getReduceStateBody(DenseParseTable.decodeReduce(action))
+        else:
+            body = self.__getShiftStateBody(state, row)
+        return [f"def {self.__getStateFunctionName(state)}({self.__stateFunctionParameters}):"] + [self.__indent + line for line in body]
+
+    def __getStateFunctionsLines(self):
+        lines = []
+        for state in range(self.__table.numberOfStates):
+            lines += self.__getStateFunctionLines(state) + ["", ""]
+        stateFunctionNames = ', '.join(map(self.__getStateFunctionName, range(self.__table.numberOfStates)))
+        lines += [f"STATE_FUNCTIONS = ({stateFunctionNames},)"]
+        return lines
+
+    def __getParseFunctionLines(self):
+        lines = [
+            "states = [0]",
+            "values = []",
+            "stateFunctions = STATE_FUNCTIONS",
+            "tokenAndLexeme = getNextTokenAndLexeme()",
+            "while True:",
+            f"{self.__indent}action = stateFunctions[states[-1]]({self.__stateFunctionParameters})",
+            f"{self.__indent}if action == SHIFTED:",
+            f"{self.__indent * 2}tokenAndLexeme = getNextTokenAndLexeme()",
+            f"{self.__indent}elif action == ACCEPTED:",
+            f"{self.__indent * 2}return values",
+        ]
+        return ["def parse(getNextTokenAndLexeme, makeTerminal, makeNonTerminal):"] + [(self.__indent + line).rstrip() for line in lines]
+
+    def getSource(self):
+        lines = [
+            "# Generated by compiler/core/parserGenerator.py, do not edit",
+            "",
+            f"GRAMMAR_HASH = {self.__grammar.getHash()!r}",
+            f"START_SYMBOL = {self.__startSymbol!r}",
+            "",
+            "REDUCED = 0",
+            "SHIFTED = 1",
+            "ACCEPTED = 2",
+            "",
+        ]
+        lines += self.__getGotoTableLines()
+        lines += ["", ""]
+        lines += self.__getStateFunctionsLines()
+        lines += ["", ""]
+        lines += self.__getParseFunctionLines()
+        return '\n'.join(lines) + '\n'
+
+    def writeModule(self, path: str):
+        with open(path, 'w') as moduleFile:
+            moduleFile.write(self.getSource())
@@ -0,0 +1,111 @@
+from re import Pattern
+from compiler.core.common.all import TokenizingRule, MasterPattern, TokenAndLexeme, CharPosition, RhsSymbol
+
+
+class StreamingLexicalAnalyzer:
+    __newLineChar = '\n'
+
+    def __init__(self, lines, rules: [TokenizingRule], ignorePatterns: [Pattern] = [], generateEof=True, errorHandler=None):
+        self.__rules = rules
+        self.__rulesPattern = MasterPattern.fromPatterns([rule.pattern for rule in rules])
+        self.__ignorePattern = MasterPattern.fromPatterns(ignorePatterns)
+        self.__lines = iter(lines)
+        self.__linesExhausted = False
+        self.__buffer = ''
+        self.__position = 0
+        self.__lineNumber = 1
+        self.__lineStart = 0
+        self.__dataFinished = False
+        self.__generateEof = generateEof
+        self.__errorHandler = errorHandler
+
+    def reachedEndOfData(self):
+        while self.__position >= len(self.__buffer):
+            if not self.__readLine():
+                return True
+        return False
+
+    def isDataFinished(self):
+        return self.__dataFinished
+
+    def __error(self, message):
+        if self.__errorHandler is not None:
+            self.__errorHandler(message)
+        else:
+            raise Exception(message)
+
+    def __compactBuffer(self):
+        if self.__lineStart > 0 and self.__lineStart * 2 >= len(self.__buffer):
+            self.__buffer = self.__buffer[self.__lineStart:]
+            self.__position -= self.__lineStart
+            self.__lineStart = 0
+
+    def __readLine(self):
+        if self.__linesExhausted:
+            return False
+        line = next(self.__lines, None)
+        if line is None:
+            self.__linesExhausted = True
+            return False
+        self.__compactBuffer()
+        self.__buffer += line
+        return True
+
+    def __mayNeedMoreData(self, match):
+        if match is None:
+            return self.__buffer.find(self.__newLineChar, self.__position) == -1
+        return self.__position + len(match[1]) == len(self.__buffer)
+
+    def __match(self, pattern: MasterPattern):
+        while True:
+            match = pattern.match(self.__buffer, self.__position)
+            if not (self.__mayNeedMoreData(match) and self.__readLine()):
+                return match
+
+    def __advance(self, length: int):
+        end = self.__position + length
+        newLines = self.__buffer.count(self.__newLineChar, self.__position, end)
+        if newLines > 0:
+            self.__lineNumber += newLines
+            self.__lineStart = self.__buffer.rfind(self.__newLineChar, self.__position, end) + 1
+        self.__position = end
+
+    def __getCurrentCharPosition(self):
+        return CharPosition(self.__lineNumber, self.__position - self.__lineStart + 1)
+
+    def __unexpectedTokenError(self):
+        lineNumber, columnNumber = self.__getCurrentCharPosition()
+        self.__error(f"Unexpected token {self.__buffer[self.__position: self.__position+3]}... at {lineNumber}:{columnNumber}")
+
+    def __skipIgnorablePrefix(self):
+        ignorablePrefixExists = True
+        while(ignorablePrefixExists):
+            ignoreMatch = None if self.reachedEndOfData() else self.__match(self.__ignorePattern)
+            ignorablePrefixExists = ignoreMatch is not None
+            if ignorablePrefixExists:
+                _, ignoreString = ignoreMatch
+                self.__advance(len(ignoreString))
+
+    def __getPrefixTokenAndLexeme(self) -> TokenAndLexeme:
+        if not self.isDataFinished():
+            if not self.reachedEndOfData():
+                ruleMatch = self.__match(self.__rulesPattern)
+                if ruleMatch is not None:
+                    ruleIndex, lexeme = ruleMatch
+                    position = self.__getCurrentCharPosition()
+                    self.__advance(len(lexeme))
+                    return TokenAndLexeme(self.__rules[ruleIndex].token, lexeme, position)
+                self.__unexpectedTokenError()
+            else:
+                self.__dataFinished = True
+                if self.__generateEof:
+                    return TokenAndLexeme(RhsSymbol.eof().value, '', self.__getCurrentCharPosition())
+
+    def nextTokenAndLexeme(self) -> TokenAndLexeme:
+        if not self.isDataFinished():
+            self.__skipIgnorablePrefix()
+            return self.__getPrefixTokenAndLexeme()
+
+    def getTokenGenerator(self):
+        while not self.isDataFinished():
+            yield self.nextTokenAndLexeme()
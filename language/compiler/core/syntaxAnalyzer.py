@@ -1,14 +1,11 @@
 from dataclasses import dataclass
-from collections import defaultdict, deque, OrderedDict
+from collections import defaultdict, deque, namedtuple
 from enum import Enum
-from compiler.core.common.all import GrammarRuleRhs, RhsSymbol, Grammar, TokenAndLexeme, Action, ActionTable, GotoTable, Item, ItemSet
+from compiler.core.common.all import GrammarRuleRhs, RhsSymbol, Grammar, TokenAndLexeme, ActionTable, GotoTable, DenseParseTable
 
 
-@dataclass(frozen=True)
-class Symbol:
-    token: str
-    children: [] = ()
-    lexeme: str = None
+class Symbol(namedtuple('Symbol', ['token', 'children', 'lexeme'], defaults=((), None))):
+    __slots__ = ()
 
     @staticmethod
     def terminal(token, lexeme):
@@ -18,6 +15,12 @@ class Symbol:
         return len(self.children) == 0
 
 
+class TranslationError(Exception):
+    def __init__(self, cause: BaseException):
+        super().__init__(cause)
+        self.cause = cause
+
+
 @dataclass(frozen=True)
 class ProductionRule:
     lhs: str
@@ -30,20 +33,53 @@ class ProductionRule:
     def __repr__(self):
         return f"{self.__class__.__name__}({self.getRuleString()})"
 
-    @staticmethod
-    def fromItem(item: Item):
-        return ProductionRule(item.getLhs(), item.getRhs())
+
+@dataclass
+class ParseStatistics:
+    statesBuilt: int = None
+    shifts: int = 0
+    reduces: int = 0
+    parseTreeNodes: int = None
+
+
+class ParseTreeBuilder:
+
+    def __init__(self):
+        self.__nodeCount = 0
+
+    def getNodeCount(self):
+        return self.__nodeCount
+
+    def translateTerminal(self, tokenAndLexeme: TokenAndLexeme):
+        self.__nodeCount += 1
+        return Symbol.terminal(tokenAndLexeme.token, tokenAndLexeme.lexeme)
+
+    def getReduceAction(self, rule: ProductionRule):
+        lhs = rule.lhs
+
+        def reduceAction(children):
+            self.__nodeCount += 1
+            return Symbol(lhs, children)
+        return reduceAction
+
+    def translateStartSymbol(self, startSymbol: str, children):
+        self.__nodeCount += 1
+        return Symbol(startSymbol, children)
 
 
 class SyntaxAnalyzer:
     __eofSymbol = RhsSymbol.eof()
 
-    def __init__(self, grammar: Grammar, startSymbol: str, getNextTokenAndLexeme, errorHandler=None):
+    def __init__(self, grammar: Grammar, startSymbol: str, getNextTokenAndLexeme, errorHandler=None, tableCache=None, directCodedParser=None, translator=None, statistics: ParseStatistics = None):
         self.__startSymbol = startSymbol
         self.__grammar = grammar
         self.__getNextTokenAndLexeme = getNextTokenAndLexeme
-        self.__itemSets = OrderedDict()
         self.__errorHandler = errorHandler
+        self.__tableCache = tableCache
+        self.__directCodedParser = directCodedParser
+        self.__translator = translator if translator is not None else ParseTreeBuilder()
+        self.__productionRules = None
+        self.__statistics = statistics
 
     def __error(self, message):
         if self.__errorHandler is not None:
@@ -73,136 +109,223 @@ class SyntaxAnalyzer:
             self.__ruleIndices[productionRule.lhs].append(index)
 
     def __createProductionRules(self):
+        if self.__productionRules is not None:
+            return
         self.__productionRules = self.__getNormalizedProductionRules(self.__grammar)
         self.__createRuleIndices()
 
-    def __getItemsFromNonTerminal(self, nonTerminal: str):
-        items = []
-        bfsQueue = deque([nonTerminal])
-        visited = defaultdict(lambda: False)
-        while len(bfsQueue) > 0:
-            currentSymbol = bfsQueue.popleft()
-            if not visited[currentSymbol]:
-                for ruleIndex in self.__ruleIndices[currentSymbol]:
-                    rule = self.__productionRules[ruleIndex]
-                    item = Item(rule.lhs, rule.rhs)
-                    items.append(item)
-                    if not item.isFinished():
-                        nextSymbol = item.getNextSymbol()
-                        if not nextSymbol.isTerminal():
-                            bfsQueue.append(nextSymbol.value)
-                visited[currentSymbol] = True
-        return items
-
-    def __getFullItemSetFromKernel(self, kernel: Item):
-        items = [kernel]
-        if not kernel.isFinished():
-            nextSymbol = kernel.getNextSymbol()
-            if not nextSymbol.isTerminal():
-                items += self.__getItemsFromNonTerminal(nextSymbol.value)
-        return ItemSet(*items)
-
-    def __assignStateToItemSet(self, itemSet: ItemSet):
-        state = self.__itemSets.get(itemSet, None)
+    # Items are (rule number, cursor index) pairs and states are keyed by their kernel items
+    def __getNextSymbol(self, item):
+        ruleNumber, cursorIndex = item
+        symbols = self.__ruleSymbols[ruleNumber]
+        return symbols[cursorIndex] if cursorIndex < len(symbols) else None
+
+    def __getClosureOfNonTerminal(self, nonTerminal: str):
+        closure = self.__nonTerminalClosures.get(nonTerminal, None)
+        if closure is None:
+            closure = []
+            bfsQueue = deque([nonTerminal])
+            visited = {nonTerminal}
+            while len(bfsQueue) > 0:
+                currentSymbol = bfsQueue.popleft()
+                for ruleNumber in self.__ruleIndices[currentSymbol]:
+                    closure.append((ruleNumber, 0))
+                    nextSymbol = self.__getNextSymbol((ruleNumber, 0))
+                    if nextSymbol is not None and not nextSymbol.isTerminal() and nextSymbol.value not in visited:
+                        visited.add(nextSymbol.value)
+                        bfsQueue.append(nextSymbol.value)
+            self.__nonTerminalClosures[nonTerminal] = closure
+        return closure
+
+    def __getClosureOfKernel(self, kernel):
+        closure = dict.fromkeys(kernel)
+        for item in kernel:
+            nextSymbol = self.__getNextSymbol(item)
+            if nextSymbol is not None and not nextSymbol.isTerminal():
+                closure.update(dict.fromkeys(self.__getClosureOfNonTerminal(nextSymbol.value)))
+        return list(closure)
+
+    def __getStateFromKernel(self, kernel: frozenset):
+        state = self.__stateFromKernel.get(kernel, None)
         if state is None:
-            self.__itemSets[itemSet] = len(self.__itemSets)
+            state = len(self.__stateKernels)
+            self.__stateFromKernel[kernel] = state
+            self.__stateKernels.append(kernel)
+        return state
 
-    def __getStateFromItemSet(self, itemSet: ItemSet):
-        self.__assignStateToItemSet(itemSet)
-        return self.__itemSets[itemSet]
+    def __getTransitionKernels(self, closure):
+        transitionKernels = {}
+        for item in closure:
+            nextSymbol = self.__getNextSymbol(item)
+            if nextSymbol is not None:
+                ruleNumber, cursorIndex = item
+                transitionKernels.setdefault(nextSymbol, []).append((ruleNumber, cursorIndex + 1))
+        return transitionKernels
 
-    def __getItemSetFromState(self, state: int):
-        try:
-            return list(self.__itemSets.keys())[state]
-        except KeyError:
-            raise Exception(f"No item set present for the given state '{state}'")
-
-    def __getTransitionsFromItemSet(self, itemSet: ItemSet):
-        transitions = defaultdict(lambda: ItemSet())
-        for item in itemSet.getItems():
-            if not item.isFinished():
-                symbol = item.getNextSymbol()
-                newItem = item.getFutureItem()
-                partialItemSet = self.__getFullItemSetFromKernel(newItem)
-                transitions[symbol] = ItemSet.union(transitions[symbol], partialItemSet)
-        return transitions
+    def __addTransitions(self, state: int, closure):
+        for symbol, kernelItems in self.__getTransitionKernels(closure).items():
+            if symbol == self.__eofSymbol:
+                self.__actionTable.addAccept(state, symbol.value)
+            else:
+                newState = self.__getStateFromKernel(frozenset(kernelItems))
+                if symbol.isTerminal():
+                    self.__actionTable.addShift(state, symbol.value, newState)
+                else:
+                    self.__gotoTable.addGoto(state, symbol.value, newState)
+
+    def __addReductions(self, state: int, closure):
+        for item in closure:
+            if self.__getNextSymbol(item) is None:
+                ruleNumber, _ = item
+                self.__actionTable.addReduce(state, ruleNumber)
 
     def __generateActionAndGotoTables(self):
-        self.__createProductionRules()
-        rootProductionRule = self.__productionRules[0]
-        rootKernel = Item(rootProductionRule.lhs, rootProductionRule.rhs)
-        rootState = self.__getStateFromItemSet(self.__getFullItemSetFromKernel(rootKernel))
-        visited = defaultdict(lambda: False)
-        bfsQueue = deque([rootState])
+        self.__ruleSymbols = [tuple(rule.rhs.getAllSymbols()) for rule in self.__productionRules]
+        self.__nonTerminalClosures = {}
+        self.__stateFromKernel = {}
+        self.__stateKernels = []
         self.__actionTable = ActionTable()
         self.__gotoTable = GotoTable()
-        while(len(bfsQueue) > 0):
-            currentState = bfsQueue.popleft()
-            if visited[currentState]:
-                continue
-            currentItemSet = self.__getItemSetFromState(currentState)
-            transitions = self.__getTransitionsFromItemSet(currentItemSet)
-            for symbol in transitions:
-                try:
-                    if symbol == self.__eofSymbol:
-                        self.__actionTable.addAccept(currentState, symbol.value)
-                    else:
-                        newItemSet = transitions[symbol]
-                        newState = self.__getStateFromItemSet(newItemSet)
-                        if not visited[newState]:
-                            bfsQueue.append(newState)
-                        if symbol.isTerminal():
-                            self.__actionTable.addShift(currentState, symbol.value, newState)
-                        else:
-                            self.__gotoTable.addGoto(currentState, symbol.value, newState)
-                    visited[currentState] = True
-                except:
-                    self.__error(f"Ill-formed grammar, please report the issue to the developer")
-
-        productionRuleMap = {rule: i for i, rule in enumerate(self.__productionRules)}
-
-        def getProductionRuleNumber(rule: ProductionRule):
-            return productionRuleMap.get(rule, None)
-
-        for itemSet in self.__itemSets:
-            state = self.__getStateFromItemSet(itemSet)
-            for item in itemSet.getItems():
-                if item.isFinished():
-                    productionRuleNumber = getProductionRuleNumber(ProductionRule.fromItem(item))
-                    if productionRuleNumber is not None:
-                        self.__actionTable.addReduce(state, productionRuleNumber)
+        self.__getStateFromKernel(frozenset([(0, 0)]))
+        state = 0
+        while state < len(self.__stateKernels):
+            closure = self.__getClosureOfKernel(self.__stateKernels[state])
+            try:
+                self.__addTransitions(state, closure)
+                self.__addReductions(state, closure)
+            except:
+                self.__error(f"Ill-formed grammar, please report the issue to the developer")
+            state += 1
+        if self.__statistics is not None:
+            self.__statistics.statesBuilt = (self.__statistics.statesBuilt or 0) + len(self.__stateKernels)
+
+    def __loadOrGenerateActionAndGotoTables(self):
+        self.__createProductionRules()
+        if self.__tableCache is not None:
+            cachedTables = self.__tableCache.load(self.__grammar, self.__startSymbol)
+            if cachedTables is not None:
+                self.__actionTable, self.__gotoTable = cachedTables
+                return
+        self.__generateActionAndGotoTables()
+        if self.__tableCache is not None:
+            self.__tableCache.save(self.__grammar, self.__startSymbol, self.__actionTable, self.__gotoTable)
+
+    def __createDenseParseTable(self):
+        ruleLhs = [rule.lhs for rule in self.__productionRules]
+        ruleLengths = [rule.rhs.getNumberOfSymbols() for rule in self.__productionRules]
+        self.__denseParseTable = DenseParseTable(self.__actionTable, self.__gotoTable, ruleLhs, ruleLengths)
+
+    def getDenseParseTable(self) -> DenseParseTable:
+        self.__loadOrGenerateActionAndGotoTables()
+        self.__createDenseParseTable()
+        return self.__denseParseTable
+
+    def __canUseDirectCodedParser(self):
+        parser = self.__directCodedParser
+        return parser is not None and parser.GRAMMAR_HASH == self.__grammar.getHash() and parser.START_SYMBOL == self.__startSymbol
 
     def __currentState(self):
         return self.__stateStack[-1]
 
     def __shift(self, toState: int, tokenAndLexeme: TokenAndLexeme):
-        self.__parseStack.append(Symbol.terminal(tokenAndLexeme.token, tokenAndLexeme.lexeme))
+        self.__parseStack.append(self.__makeTerminal(tokenAndLexeme))
         self.__stateStack.append(toState)
 
     def __reduce(self, ruleNumber: int):
-        rule = self.__productionRules[ruleNumber]
-        numberOfSymbols = rule.rhs.getNumberOfSymbols()
-        self.__stateStack = self.__stateStack[:-numberOfSymbols]
+        table = self.__denseParseTable
+        lhsId = table.ruleLhsIds[ruleNumber]
+        numberOfSymbols = table.ruleLengths[ruleNumber]
         children = self.__parseStack[-numberOfSymbols:]
-        self.__parseStack = self.__parseStack[:-numberOfSymbols]
-        self.__parseStack.append(Symbol(rule.lhs, children))
-        self.__stateStack.append(self.__gotoTable.getStateToGoTo(self.__currentState(), rule.lhs))
+        del self.__parseStack[-numberOfSymbols:]
+        del self.__stateStack[-numberOfSymbols:]
+        self.__parseStack.append(self.__makeNonTerminal(ruleNumber, table.nonTerminals[lhsId], children))
+        self.__stateStack.append(table.getStateToGoTo(self.__currentState(), lhsId))
 
-    def parse(self):
-        self.__generateActionAndGotoTables()
+    def __createReduceActions(self):
+        self.__reduceActions = [self.__translator.getReduceAction(rule) for rule in self.__productionRules]
+        self.__makeTerminal = self.__translator.translateTerminal
+        if self.__statistics is not None:
+            self.__countParseSteps()
+
+    def __countParseSteps(self):
+        statistics = self.__statistics
+        makeTerminal = self.__makeTerminal
+
+        def countingMakeTerminal(tokenAndLexeme: TokenAndLexeme):
+            statistics.shifts += 1
+            return makeTerminal(tokenAndLexeme)
+
+        def getCountingReduceAction(reduceAction):
+            def countingReduceAction(children):
+                statistics.reduces += 1
+                return reduceAction(children)
+            return countingReduceAction
+
+        self.__makeTerminal = countingMakeTerminal
+        self.__reduceActions = [getCountingReduceAction(reduceAction) for reduceAction in self.__reduceActions]
+
+    def __makeNonTerminal(self, ruleNumber: int, lhs: str, children):
+        try:
+            return self.__reduceActions[ruleNumber](children)
+        except BaseException as error:
+            raise TranslationError(error)
+
+    def __parseWithDirectCodedParser(self):
+        lastTokenAndLexeme = None
+
+        def getNextTokenAndLexeme():
+            nonlocal lastTokenAndLexeme
+            lastTokenAndLexeme = self.__getNextTokenAndLexeme()
+            return lastTokenAndLexeme
+
+        try:
+            children = self.__directCodedParser.parse(getNextTokenAndLexeme, self.__makeTerminal, self.__makeNonTerminal)
+        except TranslationError as error:
+            raise error.cause
+        except:
+            if lastTokenAndLexeme is None:
+                raise
+            lineNumber, columnNumber = lastTokenAndLexeme.position
+            self.__error(f"Syntax error at {lineNumber}:{columnNumber}")
+            return None
+        return self.__translator.translateStartSymbol(self.__startSymbol, children)
+
+    def __parseWithDenseParseTable(self):
+        table = self.getDenseParseTable()
+        actions, actionRowWidth = table.actions, table.actionRowWidth
+        terminalIds, unknownTerminalId = table.terminalIds, table.unknownTerminalId
         self.__parseStack: [Symbol] = []
         self.__stateStack: [int] = [0]
         tokenAndLexeme: TokenAndLexeme = self.__getNextTokenAndLexeme()
-        while True:
+        terminalId = terminalIds.get(tokenAndLexeme.token, unknownTerminalId)
+        accepted = False
+        while not accepted:
             try:
-                action: Action = self.__actionTable.getActionAtCell(self.__currentState(), tokenAndLexeme.token)
-                if action.isShift():
-                    self.__shift(action.toState, tokenAndLexeme)
+                action = actions[self.__stateStack[-1] * actionRowWidth + terminalId]
+                if action > 0:
+                    self.__shift(DenseParseTable.decodeShift(action), tokenAndLexeme)
                     tokenAndLexeme: TokenAndLexeme = self.__getNextTokenAndLexeme()
-                elif action.isReduce():
-                    self.__reduce(action.ruleNumber)
-                elif action.isAccept():
-                    return Symbol(self.__startSymbol, self.__parseStack)
+                    terminalId = terminalIds.get(tokenAndLexeme.token, unknownTerminalId)
+                elif action < DenseParseTable.ACCEPT:
+                    self.__reduce(DenseParseTable.decodeReduce(action))
+                elif action == DenseParseTable.ACCEPT:
+                    accepted = True
+                else:
+                    raise Exception(f"No action specified for state '{self.__currentState()}' and terminal '{tokenAndLexeme.token}'")
+            except TranslationError as error:
+                raise error.cause
             except:
                 lineNumber, columnNumber = tokenAndLexeme.position
                 self.__error(f"Syntax error at {lineNumber}:{columnNumber}")
+        return self.__translator.translateStartSymbol(self.__startSymbol, self.__parseStack)
+
+    def parse(self):
+        self.__createProductionRules()
+        self.__createReduceActions()
+        if self.__canUseDirectCodedParser():
+            output = self.__parseWithDirectCodedParser()
+        else:
+            output = self.__parseWithDenseParseTable()
+        if self.__statistics is not None and isinstance(self.__translator, ParseTreeBuilder):
+            self.__statistics.parseTreeNodes = self.__translator.getNodeCount()
+        return output
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import tempfile
+from compiler.core.common.all import Grammar, ActionTable, GotoTable
+
+
+class TableCache:
+    __formatVersion = 1
+
+    def __init__(self, directory: str = None):
+        self.__directory = directory
+        self.__loadedTables = {}
+
+    def __getKey(self, grammar: Grammar, startSymbol: str):
+        keyString = f"{self.__formatVersion}\n{startSymbol}\n{grammar.getHash()}"
+        return hashlib.sha256(keyString.encode('utf-8')).hexdigest()
+
+    def __getFilePath(self, key: str):
+        return os.path.join(self.__directory, f"parse-tables-{key[:32]}.json")
+
+    @staticmethod
+    def __createTables(entries):
+        actionTable = ActionTable()
+        gotoTable = GotoTable()
+        for state, terminal, toState in entries['shift']:
+            actionTable.addShift(state, terminal, toState)
+        for state, terminal in entries['accept']:
+            actionTable.addAccept(state, terminal)
+        for state, ruleNumber in entries['reduce']:
+            actionTable.addReduce(state, ruleNumber)
+        for state, nonTerminal, toState in entries['goto']:
+            gotoTable.addGoto(state, nonTerminal, toState)
+        return actionTable, gotoTable
+
+    @staticmethod
+    def __getEntries(actionTable: ActionTable, gotoTable: GotoTable):
+        return {
+            'shift': actionTable.getShiftEntries(),
+            'accept': actionTable.getAcceptEntries(),
+            'reduce': actionTable.getReduceEntries(),
+            'goto': gotoTable.getGotoEntries(),
+        }
+
+    def __readEntries(self, key: str):
+        if self.__directory is None:
+            return None
+        try:
+            with open(self.__getFilePath(key), 'r') as cacheFile:
+                cached = json.load(cacheFile)
+            if cached['version'] == self.__formatVersion and cached['key'] == key:
+                return cached['entries']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def __writeEntries(self, key: str, entries):
+        if self.__directory is None:
+            return
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+            fileDescriptor, temporaryPath = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fileDescriptor, 'w') as cacheFile:
+                json.dump({'version': self.__formatVersion, 'key': key, 'entries': entries}, cacheFile)
+            os.replace(temporaryPath, self.__getFilePath(key))
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+
+    def load(self, grammar: Grammar, startSymbol: str):
+        key = self.__getKey(grammar, startSymbol)
+        tables = self.__loadedTables.get(key, None)
+        if tables is None:
+            entries = self.__readEntries(key)
+            if entries is not None:
+                try:
+                    tables = self.__createTables(entries)
+                except Exception:
+                    return None
+                self.__loadedTables[key] = tables
+        return tables
+
+    def save(self, grammar: Grammar, startSymbol: str, actionTable: ActionTable, gotoTable: GotoTable):
+        key = self.__getKey(grammar, startSymbol)
+        self.__loadedTables[key] = (actionTable, gotoTable)
+        self.__writeEntries(key, self.__getEntries(actionTable, gotoTable))
@@ -0,0 +1,11 @@
+import os
+from compiler.core.parserGenerator import ParserGenerator
+from compiler.grammar import grammar
+from compiler.symbols import NT_PROG
+
+GENERATED_PARSER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generatedParser.py')
+
+
+if __name__ == '__main__':
+    ParserGenerator(grammar, NT_PROG).writeModule(GENERATED_PARSER_PATH)
+    print(f"Parser written to {GENERATED_PARSER_PATH}")
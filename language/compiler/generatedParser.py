@@ -0,0 +1,1319 @@
+# Generated by compiler/core/parserGenerator.py, do not edit
+
+GRAMMAR_HASH = '4812b240ae432e5bb258c265e2835879319681513c9779561d36603ab4ae2bbf'
+START_SYMBOL = 'prog'
+
+REDUCED = 0
+SHIFTED = 1
+ACCEPTED = 2
+
+# prog
+GOTO_0 = {}
+# top-level-stmts
+GOTO_1 = {2: 3}
+# top-level-stmt
+GOTO_2 = {2: 4, 9: 12}
+# shape-def
+GOTO_3 = {2: 5, 9: 5}
+# state-def
+GOTO_4 = {2: 6, 9: 6}
+# instate-stmts
+GOTO_5 = {14: 16}
+# instate-stmt
+GOTO_6 = {14: 17, 36: 48}
+# variable-update-stmt
+GOTO_7 = {14: 18, 36: 18, 51: 60, 64: 73, 67: 81, 70: 60, 78: 73, 86: 81, 90: 73, 92: 81, 97: 73, 100: 81}
+# screen-update-stmt
+GOTO_8 = {14: 19, 36: 19, 51: 61, 64: 74, 67: 82, 70: 61, 78: 74, 86: 82, 90: 74, 92: 82, 97: 74, 100: 82}
+# goto-stmt
+GOTO_9 = {14: 20, 36: 20, 51: 62, 64: 75, 67: 83, 70: 62, 78: 75, 86: 83, 90: 75, 92: 83, 97: 75, 100: 83}
+# selection-stmt
+GOTO_10 = {14: 21, 36: 21, 51: 63, 64: 76, 67: 84, 70: 63, 78: 76, 86: 84, 90: 76, 92: 84, 97: 76, 100: 84}
+# iteration-stmt
+GOTO_11 = {14: 22, 36: 22, 64: 77, 67: 85, 78: 77, 86: 85, 90: 77, 92: 85, 97: 77, 100: 85}
+# btn-handler
+GOTO_12 = {14: 23, 36: 23}
+# expression
+GOTO_13 = {33: 41, 34: 45, 37: 49, 42: 53, 46: 56, 57: 69, 87: 94}
+# if-stmt
+GOTO_14 = {14: 28, 36: 28, 51: 28, 64: 28, 67: 28, 70: 28, 78: 28, 86: 28, 90: 28, 92: 28, 97: 28, 100: 28}
+# if-not-stmt
+GOTO_15 = {14: 29, 36: 29, 51: 29, 64: 29, 67: 29, 70: 29, 78: 29, 86: 29, 90: 29, 92: 29, 97: 29, 100: 29}
+# while-stmt
+GOTO_16 = {14: 30, 36: 30, 64: 30, 67: 30, 78: 30, 86: 30, 90: 30, 92: 30, 97: 30, 100: 30}
+# while-not-stmt
+GOTO_17 = {14: 31, 36: 31, 64: 31, 67: 31, 78: 31, 86: 31, 90: 31, 92: 31, 97: 31, 100: 31}
+# inhandler-stmts
+GOTO_18 = {51: 58}
+# inif-stmts
+GOTO_19 = {64: 71, 78: 91}
+# inwhile-stmts
+GOTO_20 = {67: 79, 86: 93}
+# inhandler-stmt
+GOTO_21 = {51: 59, 70: 89}
+# inif-stmt
+GOTO_22 = {64: 72, 78: 72, 90: 96, 97: 96}
+# inwhile-stmt
+GOTO_23 = {67: 80, 86: 80, 92: 99, 100: 99}
+
+
+def state0(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'state-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(1)
+        return SHIFTED
+    raise Exception(f"No action specified for state '0' and terminal '{token}'")
+
+
+def state1(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(2)
+        return SHIFTED
+    raise Exception(f"No action specified for state '1' and terminal '{token}'")
+
+
+def state2(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'state-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(8)
+        return SHIFTED
+    if token == 'shape-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(7)
+        return SHIFTED
+    raise Exception(f"No action specified for state '2' and terminal '{token}'")
+
+
+def state3(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(9)
+        return SHIFTED
+    raise Exception(f"No action specified for state '3' and terminal '{token}'")
+
+
+def state4(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(2, 'top-level-stmts', children))
+    states.append(GOTO_1[states[-1]])
+    return REDUCED
+
+
+def state5(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(3, 'top-level-stmt', children))
+    states.append(GOTO_2[states[-1]])
+    return REDUCED
+
+
+def state6(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(4, 'top-level-stmt', children))
+    states.append(GOTO_2[states[-1]])
+    return REDUCED
+
+
+def state7(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(10)
+        return SHIFTED
+    raise Exception(f"No action specified for state '7' and terminal '{token}'")
+
+
+def state8(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(11)
+        return SHIFTED
+    raise Exception(f"No action specified for state '8' and terminal '{token}'")
+
+
+def state9(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'state-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(8)
+        return SHIFTED
+    if token == 'shape-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(7)
+        return SHIFTED
+    if token == '__eof__':
+        return ACCEPTED
+    raise Exception(f"No action specified for state '9' and terminal '{token}'")
+
+
+def state10(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(13)
+        return SHIFTED
+    raise Exception(f"No action specified for state '10' and terminal '{token}'")
+
+
+def state11(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(14)
+        return SHIFTED
+    raise Exception(f"No action specified for state '11' and terminal '{token}'")
+
+
+def state12(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(1, 'top-level-stmts', children))
+    states.append(GOTO_1[states[-1]])
+    return REDUCED
+
+
+def state13(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(15)
+        return SHIFTED
+    raise Exception(f"No action specified for state '13' and terminal '{token}'")
+
+
+def state14(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'handler-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(32)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    raise Exception(f"No action specified for state '14' and terminal '{token}'")
+
+
+def state15(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(35)
+        return SHIFTED
+    raise Exception(f"No action specified for state '15' and terminal '{token}'")
+
+
+def state16(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(36)
+        return SHIFTED
+    raise Exception(f"No action specified for state '16' and terminal '{token}'")
+
+
+def state17(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(8, 'instate-stmts', children))
+    states.append(GOTO_5[states[-1]])
+    return REDUCED
+
+
+def state18(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(9, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state19(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(10, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state20(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(11, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state21(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(12, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state22(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(13, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state23(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(14, 'instate-stmt', children))
+    states.append(GOTO_6[states[-1]])
+    return REDUCED
+
+
+def state24(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'assignment-op':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(37)
+        return SHIFTED
+    raise Exception(f"No action specified for state '24' and terminal '{token}'")
+
+
+def state25(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(16, 'screen-update-stmt', children))
+    states.append(GOTO_8[states[-1]])
+    return REDUCED
+
+
+def state26(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'shape-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(38)
+        return SHIFTED
+    raise Exception(f"No action specified for state '26' and terminal '{token}'")
+
+
+def state27(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'state-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(39)
+        return SHIFTED
+    raise Exception(f"No action specified for state '27' and terminal '{token}'")
+
+
+def state28(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(19, 'selection-stmt', children))
+    states.append(GOTO_10[states[-1]])
+    return REDUCED
+
+
+def state29(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(20, 'selection-stmt', children))
+    states.append(GOTO_10[states[-1]])
+    return REDUCED
+
+
+def state30(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(21, 'iteration-stmt', children))
+    states.append(GOTO_11[states[-1]])
+    return REDUCED
+
+
+def state31(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(22, 'iteration-stmt', children))
+    states.append(GOTO_11[states[-1]])
+    return REDUCED
+
+
+def state32(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(40)
+        return SHIFTED
+    raise Exception(f"No action specified for state '32' and terminal '{token}'")
+
+
+def state33(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'not':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(42)
+        return SHIFTED
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '33' and terminal '{token}'")
+
+
+def state34(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'not':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(46)
+        return SHIFTED
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '34' and terminal '{token}'")
+
+
+def state35(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-5:]
+    del values[-5:]
+    del states[-5:]
+    values.append(makeNonTerminal(5, 'shape-def', children))
+    states.append(GOTO_3[states[-1]])
+    return REDUCED
+
+
+def state36(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'handler-name':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(32)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(47)
+        return SHIFTED
+    raise Exception(f"No action specified for state '36' and terminal '{token}'")
+
+
+def state37(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '37' and terminal '{token}'")
+
+
+def state38(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'coordinate-op':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(50)
+        return SHIFTED
+    raise Exception(f"No action specified for state '38' and terminal '{token}'")
+
+
+def state39(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-2:]
+    del values[-2:]
+    del states[-2:]
+    values.append(makeNonTerminal(18, 'goto-stmt', children))
+    states.append(GOTO_9[states[-1]])
+    return REDUCED
+
+
+def state40(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(51)
+        return SHIFTED
+    raise Exception(f"No action specified for state '40' and terminal '{token}'")
+
+
+def state41(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(52)
+        return SHIFTED
+    raise Exception(f"No action specified for state '41' and terminal '{token}'")
+
+
+def state42(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '42' and terminal '{token}'")
+
+
+def state43(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(24, 'expression', children))
+    states.append(GOTO_13[states[-1]])
+    return REDUCED
+
+
+def state44(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(54)
+        return SHIFTED
+    raise Exception(f"No action specified for state '44' and terminal '{token}'")
+
+
+def state45(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(55)
+        return SHIFTED
+    raise Exception(f"No action specified for state '45' and terminal '{token}'")
+
+
+def state46(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '46' and terminal '{token}'")
+
+
+def state47(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-6:]
+    del values[-6:]
+    del states[-6:]
+    values.append(makeNonTerminal(6, 'state-def', children))
+    states.append(GOTO_4[states[-1]])
+    return REDUCED
+
+
+def state48(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(7, 'instate-stmts', children))
+    states.append(GOTO_5[states[-1]])
+    return REDUCED
+
+
+def state49(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(15, 'variable-update-stmt', children))
+    states.append(GOTO_7[states[-1]])
+    return REDUCED
+
+
+def state50(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-paren':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(57)
+        return SHIFTED
+    raise Exception(f"No action specified for state '50' and terminal '{token}'")
+
+
+def state51(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    raise Exception(f"No action specified for state '51' and terminal '{token}'")
+
+
+def state52(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(64)
+        return SHIFTED
+    raise Exception(f"No action specified for state '52' and terminal '{token}'")
+
+
+def state53(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(65)
+        return SHIFTED
+    raise Exception(f"No action specified for state '53' and terminal '{token}'")
+
+
+def state54(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(66)
+        return SHIFTED
+    raise Exception(f"No action specified for state '54' and terminal '{token}'")
+
+
+def state55(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(67)
+        return SHIFTED
+    raise Exception(f"No action specified for state '55' and terminal '{token}'")
+
+
+def state56(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'left-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(68)
+        return SHIFTED
+    raise Exception(f"No action specified for state '56' and terminal '{token}'")
+
+
+def state57(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '57' and terminal '{token}'")
+
+
+def state58(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(70)
+        return SHIFTED
+    raise Exception(f"No action specified for state '58' and terminal '{token}'")
+
+
+def state59(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(31, 'inhandler-stmts', children))
+    states.append(GOTO_18[states[-1]])
+    return REDUCED
+
+
+def state60(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(36, 'inhandler-stmt', children))
+    states.append(GOTO_21[states[-1]])
+    return REDUCED
+
+
+def state61(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(37, 'inhandler-stmt', children))
+    states.append(GOTO_21[states[-1]])
+    return REDUCED
+
+
+def state62(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(38, 'inhandler-stmt', children))
+    states.append(GOTO_21[states[-1]])
+    return REDUCED
+
+
+def state63(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(39, 'inhandler-stmt', children))
+    states.append(GOTO_21[states[-1]])
+    return REDUCED
+
+
+def state64(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    raise Exception(f"No action specified for state '64' and terminal '{token}'")
+
+
+def state65(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(78)
+        return SHIFTED
+    raise Exception(f"No action specified for state '65' and terminal '{token}'")
+
+
+def state66(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(25, 'expression', children))
+    states.append(GOTO_13[states[-1]])
+    return REDUCED
+
+
+def state67(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    raise Exception(f"No action specified for state '67' and terminal '{token}'")
+
+
+def state68(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(86)
+        return SHIFTED
+    raise Exception(f"No action specified for state '68' and terminal '{token}'")
+
+
+def state69(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'comma':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(87)
+        return SHIFTED
+    raise Exception(f"No action specified for state '69' and terminal '{token}'")
+
+
+def state70(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(88)
+        return SHIFTED
+    raise Exception(f"No action specified for state '70' and terminal '{token}'")
+
+
+def state71(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(90)
+        return SHIFTED
+    raise Exception(f"No action specified for state '71' and terminal '{token}'")
+
+
+def state72(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(33, 'inif-stmts', children))
+    states.append(GOTO_19[states[-1]])
+    return REDUCED
+
+
+def state73(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(40, 'inif-stmt', children))
+    states.append(GOTO_22[states[-1]])
+    return REDUCED
+
+
+def state74(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(41, 'inif-stmt', children))
+    states.append(GOTO_22[states[-1]])
+    return REDUCED
+
+
+def state75(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(42, 'inif-stmt', children))
+    states.append(GOTO_22[states[-1]])
+    return REDUCED
+
+
+def state76(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(43, 'inif-stmt', children))
+    states.append(GOTO_22[states[-1]])
+    return REDUCED
+
+
+def state77(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(44, 'inif-stmt', children))
+    states.append(GOTO_22[states[-1]])
+    return REDUCED
+
+
+def state78(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    raise Exception(f"No action specified for state '78' and terminal '{token}'")
+
+
+def state79(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(92)
+        return SHIFTED
+    raise Exception(f"No action specified for state '79' and terminal '{token}'")
+
+
+def state80(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(35, 'inwhile-stmts', children))
+    states.append(GOTO_20[states[-1]])
+    return REDUCED
+
+
+def state81(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(45, 'inwhile-stmt', children))
+    states.append(GOTO_23[states[-1]])
+    return REDUCED
+
+
+def state82(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(46, 'inwhile-stmt', children))
+    states.append(GOTO_23[states[-1]])
+    return REDUCED
+
+
+def state83(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(47, 'inwhile-stmt', children))
+    states.append(GOTO_23[states[-1]])
+    return REDUCED
+
+
+def state84(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(48, 'inwhile-stmt', children))
+    states.append(GOTO_23[states[-1]])
+    return REDUCED
+
+
+def state85(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-1:]
+    del values[-1:]
+    del states[-1:]
+    values.append(makeNonTerminal(49, 'inwhile-stmt', children))
+    states.append(GOTO_23[states[-1]])
+    return REDUCED
+
+
+def state86(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    raise Exception(f"No action specified for state '86' and terminal '{token}'")
+
+
+def state87(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'single-expression':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(43)
+        return SHIFTED
+    if token == 'rand':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(44)
+        return SHIFTED
+    raise Exception(f"No action specified for state '87' and terminal '{token}'")
+
+
+def state88(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-6:]
+    del values[-6:]
+    del states[-6:]
+    values.append(makeNonTerminal(23, 'btn-handler', children))
+    states.append(GOTO_12[states[-1]])
+    return REDUCED
+
+
+def state89(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(30, 'inhandler-stmts', children))
+    states.append(GOTO_18[states[-1]])
+    return REDUCED
+
+
+def state90(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(95)
+        return SHIFTED
+    raise Exception(f"No action specified for state '90' and terminal '{token}'")
+
+
+def state91(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(97)
+        return SHIFTED
+    raise Exception(f"No action specified for state '91' and terminal '{token}'")
+
+
+def state92(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(98)
+        return SHIFTED
+    raise Exception(f"No action specified for state '92' and terminal '{token}'")
+
+
+def state93(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'newline':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(100)
+        return SHIFTED
+    raise Exception(f"No action specified for state '93' and terminal '{token}'")
+
+
+def state94(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'right-paren':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(101)
+        return SHIFTED
+    raise Exception(f"No action specified for state '94' and terminal '{token}'")
+
+
+def state95(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-7:]
+    del values[-7:]
+    del states[-7:]
+    values.append(makeNonTerminal(26, 'if-stmt', children))
+    states.append(GOTO_14[states[-1]])
+    return REDUCED
+
+
+def state96(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(32, 'inif-stmts', children))
+    states.append(GOTO_19[states[-1]])
+    return REDUCED
+
+
+def state97(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(102)
+        return SHIFTED
+    raise Exception(f"No action specified for state '97' and terminal '{token}'")
+
+
+def state98(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-7:]
+    del values[-7:]
+    del states[-7:]
+    values.append(makeNonTerminal(28, 'while-stmt', children))
+    states.append(GOTO_16[states[-1]])
+    return REDUCED
+
+
+def state99(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-3:]
+    del values[-3:]
+    del states[-3:]
+    values.append(makeNonTerminal(34, 'inwhile-stmts', children))
+    states.append(GOTO_20[states[-1]])
+    return REDUCED
+
+
+def state100(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    token = tokenAndLexeme.token
+    if token == 'variable':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(24)
+        return SHIFTED
+    if token == 'clear-screen':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(25)
+        return SHIFTED
+    if token == 'display-shape':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(26)
+        return SHIFTED
+    if token == 'goto':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(27)
+        return SHIFTED
+    if token == 'if':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(33)
+        return SHIFTED
+    if token == 'while':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(34)
+        return SHIFTED
+    if token == 'right-brace':
+        values.append(makeTerminal(tokenAndLexeme))
+        states.append(103)
+        return SHIFTED
+    raise Exception(f"No action specified for state '100' and terminal '{token}'")
+
+
+def state101(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-8:]
+    del values[-8:]
+    del states[-8:]
+    values.append(makeNonTerminal(17, 'screen-update-stmt', children))
+    states.append(GOTO_8[states[-1]])
+    return REDUCED
+
+
+def state102(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-8:]
+    del values[-8:]
+    del states[-8:]
+    values.append(makeNonTerminal(27, 'if-not-stmt', children))
+    states.append(GOTO_15[states[-1]])
+    return REDUCED
+
+
+def state103(tokenAndLexeme, states, values, makeTerminal, makeNonTerminal):
+    children = values[-8:]
+    del values[-8:]
+    del states[-8:]
+    values.append(makeNonTerminal(29, 'while-not-stmt', children))
+    states.append(GOTO_17[states[-1]])
+    return REDUCED
+
+
+STATE_FUNCTIONS = (state0, state1, state2, state3, state4, state5, state6, state7, state8, state9, state10, state11, state12, state13, state14, state15, state16, state17, state18, state19, state20, state21, state22, state23, state24, state25, state26, state27, state28, state29, state30, state31, state32, state33, state34, state35, state36, state37, state38, state39, state40, state41, state42, state43, state44, state45, state46, state47, state48, state49, state50, state51, state52, state53, state54, state55, state56, state57, state58, state59, state60, state61, state62, state63, state64, state65, state66, state67, state68, state69, state70, state71, state72, state73, state74, state75, state76, state77, state78, state79, state80, state81, state82, state83, state84, state85, state86, state87, state88, state89, state90, state91, state92, state93, state94, state95, state96, state97, state98, state99, state100, state101, state102, state103,)
+
+
+def parse(getNextTokenAndLexeme, makeTerminal, makeNonTerminal):
+    states = [0]
+    values = []
+    stateFunctions = STATE_FUNCTIONS
+    tokenAndLexeme = getNextTokenAndLexeme()
+    while True:
+        action = stateFunctions[states[-1]](tokenAndLexeme, states, values, makeTerminal, makeNonTerminal)
+        if action == SHIFTED:
+            tokenAndLexeme = getNextTokenAndLexeme()
+        elif action == ACCEPTED:
+            return values
@@ -1,40 +1,210 @@
+import os
+from contextlib import nullcontext
+from mmap import mmap
 from compiler.core.lexicalAnalyzer import LexicalAnalyzer
-from compiler.core.syntaxAnalyzer import SyntaxAnalyzer
+from compiler.core.streamingLexicalAnalyzer import StreamingLexicalAnalyzer
+from compiler.core.syntaxAnalyzer import SyntaxAnalyzer, ParseStatistics
+from compiler.core.tableCache import TableCache
+from compiler.cache import getCacheDirectory
+from compiler.artifactCache import ArtifactCache
+from compiler.compileProfile import CompileProfile, PartTimer
 from compiler.preprocessor import Preprocessor
+from compiler.sourceReader import getSourceLines
 from compiler.grammar import grammar
+from compiler import generatedParser
 from compiler.lexerPatterns import tokenizingRules, ignorePatterns
 from compiler.semanticAnalyzer import SemanticAnalyzer
+from compiler.optimizer import Optimizer
+from compiler.codeObjects import Game, Display
+from compiler.syntaxDirectedTranslator import SyntaxDirectedTranslator
 from compiler.symbols import NT_PROG
 
+defaultTableCache = TableCache(getCacheDirectory())
+defaultArtifactCache = ArtifactCache(getCacheDirectory())
+
+
+class Backend:
+    INTERPRETER = 'interpreter'
+    CODEGEN = 'codegen'
+
+
+class DisplayBackend:
+    LISTS = 'lists'
+    NUMPY = 'numpy'
+    BITS = 'bits'
+
+    @staticmethod
+    def getDisplayClass(displayBackend: str):
+        if displayBackend == DisplayBackend.NUMPY:
+            from compiler.numpyDisplay import NumPyDisplay
+            return NumPyDisplay
+        if displayBackend == DisplayBackend.BITS:
+            from compiler.bitDisplay import BitDisplay
+            return BitDisplay
+        return Display
+
 
 class Compiler:
 
-    def __init__(self, code: str, W, H, fps, errorHandler=None):
+    def __init__(self, code: str, W, H, fps, errorHandler=None, tableCache=defaultTableCache, directCodedParser=generatedParser, buildParseTree=False, backend=Backend.INTERPRETER, optimize=True, artifactCache=defaultArtifactCache, profile=False, displayBackend=DisplayBackend.LISTS, drawList=False, profileMemory=False):
         assert W >= 1 and H >= 1 and fps >= 1, "Width, height and FPS must be positive integers"
+        assert backend in [Backend.INTERPRETER, Backend.CODEGEN], f"Unknown backend {backend}"
+        assert displayBackend in [DisplayBackend.LISTS, DisplayBackend.NUMPY, DisplayBackend.BITS], f"Unknown display backend {displayBackend}"
         self.__W = int(W)
         self.__H = int(H)
         self.__fps = int(fps)
         self.__originalCode = code
-        self.__errorHandler = errorHandler
+        self.__source = None
+        self.__userErrorHandler = errorHandler
+        self.__errorHandler = self.__reportError if errorHandler is not None else None
+        self.__errorCount = 0
+        self.__tableCache = tableCache
+        self.__directCodedParser = directCodedParser
+        self.__buildParseTree = buildParseTree
+        self.__backend = backend
+        self.__optimize = optimize
+        self.__artifactCache = artifactCache
+        self.__displayBackend = displayBackend
+        self.__drawList = drawList
+        self.__profile = CompileProfile(traceMemory=profileMemory) if profile else None
+        self.__preprocessTimer = None
+        self.__lexTimer = None
+
+    @staticmethod
+    def fromSource(source, W, H, fps, **options):
+        compiler = Compiler(None, W, H, fps, **options)
+        compiler.__source = source
+        return compiler
+
+    def __reportError(self, message):
+        self.__errorCount += 1
+        return self.__userErrorHandler(message)
+
+    def getProfile(self):
+        return self.__profile
+
+    def __phase(self, name: str):
+        if self.__profile is None:
+            return nullcontext()
+        return self.__profile.phase(name)
+
+    def __recordLexAndParseParts(self, phaseProfile):
+        if phaseProfile is None or self.__lexTimer is None:
+            return
+        lexSeconds = self.__lexTimer.seconds
+        if self.__preprocessTimer is not None:
+            phaseProfile.parts['preprocess'] = self.__preprocessTimer.seconds
+            lexSeconds -= self.__preprocessTimer.seconds
+        phaseProfile.parts['lex'] = lexSeconds
+        phaseProfile.parts['parse'] = phaseProfile.seconds - self.__lexTimer.seconds
 
     def __runPreprocessor(self, code: str):
         preprocessor = Preprocessor(code)
         processedCode = preprocessor.getProcessedCode()
         return processedCode
 
+    def __getTranslator(self):
+        if self.__buildParseTree:
+            return None
+        return SyntaxDirectedTranslator(self.__W, self.__H, self.__fps, errorHandler=self.__errorHandler)
+
+    def __runSyntaxAnalysis(self, getNextTokenAndLexeme):
+        statistics = None
+        if self.__profile is not None:
+            self.__lexTimer = PartTimer()
+            getNextTokenAndLexeme = self.__lexTimer.timeFunction(getNextTokenAndLexeme)
+            statistics = ParseStatistics()
+        parser = SyntaxAnalyzer(grammar, NT_PROG, getNextTokenAndLexeme, errorHandler=self.__errorHandler, tableCache=self.__tableCache,
+                                directCodedParser=self.__directCodedParser, translator=self.__getTranslator(), statistics=statistics)
+        parseOutput = parser.parse()
+        if self.__profile is not None:
+            self.__profile.addCounters(tokens=self.__lexTimer.calls, statesBuilt=statistics.statesBuilt, shifts=statistics.shifts,
+                                       reduces=statistics.reduces, parseTreeNodes=statistics.parseTreeNodes)
+        return parseOutput
+
     def __runLexicalAndSyntaxAnalysis(self, code: str):
         lexer = LexicalAnalyzer(code, tokenizingRules, ignorePatterns, errorHandler=self.__errorHandler)
-        parser = SyntaxAnalyzer(grammar, NT_PROG, lexer.nextTokenAndLexeme, errorHandler=self.__errorHandler)
-        parseTree = parser.parse()
-        return parseTree
+        return self.__runSyntaxAnalysis(lexer.nextTokenAndLexeme)
+
+    def __runStreamingPreprocessorAndLexicalAndSyntaxAnalysis(self, source):
+        processedLines = Preprocessor.getProcessedLines(getSourceLines(source))
+        if self.__profile is not None:
+            self.__preprocessTimer = PartTimer()
+            processedLines = self.__preprocessTimer.timeIterator(processedLines)
+        lexer = StreamingLexicalAnalyzer(processedLines, tokenizingRules, ignorePatterns, errorHandler=self.__errorHandler)
+        return self.__runSyntaxAnalysis(lexer.getTokenGenerator().__next__)
 
     def __runSemanticAnalyzer(self, parseTree):
         semanticAnalyzer = SemanticAnalyzer(parseTree, self.__W, self.__H, self.__fps, errorHandler=self.__errorHandler)
         game = semanticAnalyzer.getOutput()
         return game
 
-    def compile(self):
-        processedCode = self.__runPreprocessor(self.__originalCode)
-        parseTree = self.__runLexicalAndSyntaxAnalysis(processedCode)
-        game = self.__runSemanticAnalyzer(parseTree)
+    def __getStateTransforms(self):
+        stateTransforms = []
+        if self.__optimize:
+            stateTransforms.append(Optimizer().optimizeStates)
+        if self.__backend == Backend.CODEGEN:
+            stateTransforms.append(Game.compileStates)
+        return stateTransforms
+
+    def __runOptimizerAndBackend(self, game):
+        game.setStateTransforms(self.__getStateTransforms())
+        if self.__displayBackend != DisplayBackend.LISTS:
+            game.setDisplayClass(DisplayBackend.getDisplayClass(self.__displayBackend))
+        if self.__drawList:
+            game.setDrawListEnabled(True)
         return game
+
+    def __getArtifactKeyFromLines(self, sourceLines):
+        return self.__artifactCache.getKey(sourceLines, self.__W, self.__H, self.__fps, self.__errorHandler is not None)
+
+    def __getArtifactKey(self):
+        if self.__artifactCache is None or not self.__artifactCache.isEnabled():
+            return None
+        if self.__source is None:
+            return self.__getArtifactKeyFromLines([self.__originalCode])
+        if isinstance(self.__source, (str, os.PathLike, mmap)):
+            return self.__getArtifactKeyFromLines(getSourceLines(self.__source))
+        if hasattr(self.__source, 'seekable') and self.__source.seekable():
+            position = self.__source.tell()
+            try:
+                return self.__getArtifactKeyFromLines(getSourceLines(self.__source))
+            finally:
+                self.__source.seek(position)
+        return None
+
+    def __runAnalysis(self):
+        if self.__source is not None:
+            with self.__phase('lexAndParse') as phaseProfile:
+                parseOutput = self.__runStreamingPreprocessorAndLexicalAndSyntaxAnalysis(self.__source)
+        else:
+            with self.__phase('preprocess'):
+                processedCode = self.__runPreprocessor(self.__originalCode)
+            with self.__phase('lexAndParse') as phaseProfile:
+                parseOutput = self.__runLexicalAndSyntaxAnalysis(processedCode)
+        self.__recordLexAndParseParts(phaseProfile)
+        if not self.__buildParseTree:
+            return parseOutput
+        with self.__phase('semanticAnalysis'):
+            game = self.__runSemanticAnalyzer(parseOutput)
+        return game
+
+    def compile(self):
+        with self.__phase('artifactLookup'):
+            artifactKey = self.__getArtifactKey()
+            program = None
+            if artifactKey is not None:
+                program = self.__artifactCache.load(artifactKey, errorHandler=self.__errorHandler)
+            if self.__profile is not None:
+                self.__profile.addCounters(hit=program is not None)
+            if program is not None:
+                game = Game.fromProgram(program, self.__W, self.__H, self.__fps)
+        if program is None:
+            game = self.__runAnalysis()
+            if game is None:
+                return None
+            if artifactKey is not None and self.__errorCount == 0:
+                with self.__phase('artifactSave'):
+                    self.__artifactCache.save(artifactKey, game.getProgram(), errorHandler=self.__errorHandler)
+        with self.__phase('optimizeAndBackend'):
+            return self.__runOptimizerAndBackend(game)
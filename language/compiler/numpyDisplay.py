@@ -0,0 +1,79 @@
+from weakref import WeakKeyDictionary
+import numpy as np
+from compiler.codeObjects import ShapePixel, DirtyRegionTracker
+
+_shapeMasks = WeakKeyDictionary()
+
+
+def getMasks(pixelArray: [[ShapePixel]]):
+    height = len(pixelArray)
+    width = max((len(row) for row in pixelArray), default=0)
+    opaqueMask = np.zeros((height, width), dtype=bool)
+    blackMask = np.zeros((height, width), dtype=bool)
+    for row, pixelRow in enumerate(pixelArray):
+        for column, shapePixel in enumerate(pixelRow):
+            opaqueMask[row, column] = shapePixel != ShapePixel.TRANSPARENT
+            blackMask[row, column] = shapePixel == ShapePixel.BLACK
+    return opaqueMask, blackMask
+
+
+def getShapeMasks(shape):
+    masks = _shapeMasks.get(shape, None)
+    if masks is None:
+        masks = getMasks(shape.getShapePixelArray())
+        _shapeMasks[shape] = masks
+    return masks
+
+
+class NumPyDisplay(DirtyRegionTracker):
+    def __init__(self, pixelArray, W: int, H: int):
+        self.__W = W
+        self.__H = H
+        self._initDirtyRegion(W, H)
+        self.__pixelArray = np.zeros((H, W), dtype=bool)
+        for row, pixelRow in enumerate(pixelArray[:H]):
+            columns = min(W, len(pixelRow))
+            self.__pixelArray[row, :columns] = pixelRow[:columns]
+
+    @staticmethod
+    def cleared(W: int, H: int):
+        return NumPyDisplay((), W, H)
+
+    def clear(self):
+        self.__pixelArray.fill(False)
+        self._markCleared()
+
+    def __overlayMasks(self, opaqueMask, blackMask, topLeftCoordinate):
+        tlX, tlY = topLeftCoordinate
+        maskHeight, maskWidth = opaqueMask.shape
+        top, bottom = max(tlY, 0), min(tlY + maskHeight, self.__H)
+        left, right = max(tlX, 0), min(tlX + maskWidth, self.__W)
+        if top >= bottom or left >= right:
+            return
+        self._markDrawn(left, top, right, bottom)
+        maskRows = slice(top - tlY, bottom - tlY)
+        maskColumns = slice(left - tlX, right - tlX)
+        np.copyto(self.__pixelArray[top:bottom, left:right], blackMask[maskRows, maskColumns], where=opaqueMask[maskRows, maskColumns])
+
+    def overlay(self, pixelArray: [[ShapePixel]], topLeftCoordinate=(0, 0)):
+        self.__overlayMasks(*getMasks(pixelArray), topLeftCoordinate)
+
+    def overlayShape(self, shape, topLeftCoordinate=(0, 0)):
+        self.__overlayMasks(*getShapeMasks(shape), topLeftCoordinate)
+
+    def isPixelOn(self, row, column):
+        return bool(self.__pixelArray[row, column])
+
+    def getPixelArray(self):
+        return self.__pixelArray
+
+    def getPixelBytes(self):
+        return self.__pixelArray.tobytes()
+
+    def __repr__(self):
+        onPixel = '#'
+        offPixel = '.'
+        def getPixelChar(pixel): return onPixel if pixel else offPixel
+        def rowMapper(row): return ''.join(map(getPixelChar, row))
+        allRowsString = '\n'.join(map(rowMapper, self.__pixelArray))
+        return f"{self.__class__.__name__}(\n{allRowsString}\n)"
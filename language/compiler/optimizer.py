@@ -0,0 +1,4 @@
+class Optimizer:
+
+    def optimizeStates(self, states, constants):
+        return {stateName: state.optimize(constants) for stateName, state in states.items()}
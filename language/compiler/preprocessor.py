@@ -2,6 +2,9 @@ import re
 
 
 class Preprocessor:
+    __commentStart = '//'
+    __trailingWhitespace = ' \t'
+
     def __init__(self, code: str):
         self.__code = code
         self.__process()
@@ -25,3 +28,17 @@ class Preprocessor:
 
     def getProcessedCode(self):
         return self.__code
+
+    @staticmethod
+    def processLine(line: str):
+        if line.endswith('\n'):
+            line = line[:-1]
+        commentIndex = line.find(Preprocessor.__commentStart)
+        if commentIndex != -1:
+            line = line[:commentIndex]
+        return line.rstrip(Preprocessor.__trailingWhitespace) + '\n'
+
+    @staticmethod
+    def getProcessedLines(lines):
+        for line in lines:
+            yield Preprocessor.processLine(line)
@@ -11,6 +11,7 @@ class SemanticAnalyzer:
         self.__fps = int(fps)
         self.__root = parseTreeRoot
         self.__errorHandler = errorHandler
+        self.__variableSlots = VariableSlots()
 
     def __error(self, message):
         if self.__errorHandler is not None:
@@ -22,7 +23,7 @@ class SemanticAnalyzer:
         return self.__prog(self.__root.children)
 
     def __singleExpr(self, exprString):
-        return Expression(exprString, errorHandler=self.__errorHandler)
+        return Expression(exprString, self.__variableSlots, errorHandler=self.__errorHandler)
 
     def __randomExpr(self, expr1String, expr2String):
         expr1 = self.__singleExpr(expr1String)
@@ -37,24 +38,32 @@ class SemanticAnalyzer:
             _, expr1, expr2 = children
             return self.__randomExpr(expr1.lexeme, expr2.lexeme)
 
+    def __flattenLeftRecursiveList(self, listSymbol, children):
+        items = []
+        while children[0].token == listSymbol:
+            listNode, _, item = children
+            items.append(item)
+            children = listNode.children
+        item, = children
+        items.append(item)
+        items.reverse()
+        return items
+
     def __shape(self, shapeString):
         return Shape.fromShapeString(shapeString)
 
     def __prog(self, children):
         initialStateName, _, topLevelStmts, _ = children
         shapes, states = self.__topLevelStmts(topLevelStmts.children)
-        return Game(states, initialStateName.lexeme, shapes, self.__W, self.__H, self.__fps)
+        return Game(states, initialStateName.lexeme, shapes, self.__W, self.__H, self.__fps, self.__variableSlots)
 
     def __topLevelStmts(self, children):
-        if children[0].token == NT_TOP_LEVEL_STMTS:
-            topLevelStmts, _, topLevelStmt = children
-            shapes1, states1 = self.__topLevelStmts(topLevelStmts.children)
-            shapes2, states2 = self.__topLevelStmt(topLevelStmt.children)
-            return {**shapes1, **shapes2}, {**states1, **states2}
-        elif children[0].token == NT_TOP_LEVEL_STMT:
-            topLevelStmt, = children
-            shapes, states = self.__topLevelStmt(topLevelStmt.children)
-            return shapes, states
+        shapes, states = {}, {}
+        for topLevelStmt in self.__flattenLeftRecursiveList(NT_TOP_LEVEL_STMTS, children):
+            newShapes, newStates = self.__topLevelStmt(topLevelStmt.children)
+            shapes.update(newShapes)
+            states.update(newStates)
+        return shapes, states
 
     def __topLevelStmt(self, children):
         if children[0].token == NT_SHAPE_DEF:
@@ -77,15 +86,12 @@ class SemanticAnalyzer:
         return stateName.lexeme, GameState(StatementsBlock(statements), handlers)
 
     def __instateStmts(self, children):
-        if children[0].token == NT_INSTATE_STMTS:
-            instateStmts, _, instateStmt = children
-            statements1, handlers1 = self.__instateStmts(instateStmts.children)
-            statements2, handlers2 = self.__instateStmt(instateStmt.children)
-            return [*statements1, *statements2], {**handlers1, **handlers2}
-        elif children[0].token == NT_INSTATE_STMT:
-            instateStmt, = children
-            statements, handlers = self.__instateStmt(instateStmt.children)
-            return statements, handlers
+        statements, handlers = [], {}
+        for instateStmt in self.__flattenLeftRecursiveList(NT_INSTATE_STMTS, children):
+            newStatements, newHandlers = self.__instateStmt(instateStmt.children)
+            statements.extend(newStatements)
+            handlers.update(newHandlers)
+        return statements, handlers
 
     def __instateStmt(self, children):
         if children[0].token == NT_VARIABLE_ASSIGN_STMT:
@@ -116,7 +122,7 @@ class SemanticAnalyzer:
     def __variableAssignStmt(self, children):
         variableName, _, expr = children
         expr = self.__expr(expr.children)
-        return VariableUpdateStatement(variableName.lexeme, expr)
+        return VariableUpdateStatement(variableName.lexeme, expr, self.__variableSlots)
 
     def __screenUpdateStmt(self, children):
         if children[0].token == T_CLEAR:
@@ -158,15 +164,7 @@ class SemanticAnalyzer:
         return IfNotStatement(conditionExpr, StatementsBlock(statements))
 
     def __inifStmts(self, children):
-        if children[0].token == NT_INIF_STMTS:
-            inifStmts, _, inifStmt = children
-            statements = self.__inifStmts(inifStmts.children)
-            statement = self.__inifStmt(inifStmt.children)
-            return [*statements, statement]
-        elif children[0].token == NT_INIF_STMT:
-            inifStmt, = children
-            statement = self.__inifStmt(inifStmt.children)
-            return [statement]
+        return [self.__inifStmt(inifStmt.children) for inifStmt in self.__flattenLeftRecursiveList(NT_INIF_STMTS, children)]
 
     def __inifStmt(self, children):
         if children[0].token == NT_VARIABLE_ASSIGN_STMT:
@@ -206,15 +204,7 @@ class SemanticAnalyzer:
         return WhileNotStatement(conditionExpr, StatementsBlock(statements))
 
     def __inwhileStmts(self, children):
-        if children[0].token == NT_INWHILE_STMTS:
-            inwhileStmts, _, inwhileStmt = children
-            statements = self.__inwhileStmts(inwhileStmts.children)
-            statement = self.__inwhileStmt(inwhileStmt.children)
-            return [*statements, statement]
-        elif children[0].token == NT_INWHILE_STMT:
-            inwhileStmt, = children
-            statement = self.__inwhileStmt(inwhileStmt.children)
-            return [statement]
+        return [self.__inwhileStmt(inwhileStmt.children) for inwhileStmt in self.__flattenLeftRecursiveList(NT_INWHILE_STMTS, children)]
 
     def __inwhileStmt(self, children):
         if children[0].token == NT_VARIABLE_ASSIGN_STMT:
@@ -240,15 +230,7 @@ class SemanticAnalyzer:
         return {getButtonFromName(handlerName.lexeme): statements}
 
     def __inhandlerStmts(self, children):
-        if children[0].token == NT_INHANDLER_STMTS:
-            inhandlerStmts, _, inhandlerStmt = children
-            statements = self.__inhandlerStmts(inhandlerStmts.children)
-            statement = self.__inhandlerStmt(inhandlerStmt.children)
-            return [*statements, statement]
-        elif children[0].token == NT_INHANDLER_STMT:
-            inhandlerStmt, = children
-            statement = self.__inhandlerStmt(inhandlerStmt.children)
-            return [statement]
+        return [self.__inhandlerStmt(inhandlerStmt.children) for inhandlerStmt in self.__flattenLeftRecursiveList(NT_INHANDLER_STMTS, children)]
 
     def __inhandlerStmt(self, children):
         if children[0].token == NT_VARIABLE_ASSIGN_STMT:
@@ -0,0 +1,28 @@
+import os
+from mmap import mmap
+
+SOURCE_ENCODING = 'utf-8'
+
+
+def openSource(path):
+    return open(path, 'r', encoding=SOURCE_ENCODING)
+
+
+def getLinesFromMmap(source: mmap):
+    source.seek(0)
+    for line in iter(source.readline, b''):
+        yield line.decode(SOURCE_ENCODING).replace('\r\n', '\n').replace('\r', '\n')
+
+
+def getLinesFromPath(path):
+    with openSource(path) as sourceFile:
+        yield from sourceFile
+
+
+def getSourceLines(source):
+    if isinstance(source, mmap):
+        return getLinesFromMmap(source)
+    elif isinstance(source, (str, os.PathLike)):
+        return getLinesFromPath(source)
+    else:
+        return iter(source)
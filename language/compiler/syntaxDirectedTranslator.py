@@ -0,0 +1,148 @@
+from compiler.symbols import *
+from compiler.codeObjects import *
+
+
+class SyntaxDirectedTranslator:
+
+    def __init__(self, W, H, fps, errorHandler=None):
+        assert W >= 1 and H >= 1 and fps >= 1, "Width, height and FPS must be positive integers"
+        self.__W = int(W)
+        self.__H = int(H)
+        self.__fps = int(fps)
+        self.__errorHandler = errorHandler
+        self.__variableSlots = VariableSlots()
+        self.__reduceActions = {
+            (NT_EXPR, T_SINGLE_EXPR): self.__singleExpr,
+            (NT_EXPR, T_RAND): self.__randomExpr,
+            (NT_TOP_LEVEL_STMTS, NT_TOP_LEVEL_STMTS): self.__appendTopLevelStmt,
+            (NT_TOP_LEVEL_STMT, NT_SHAPE_DEF): self.__shapeTopLevelStmt,
+            (NT_TOP_LEVEL_STMT, NT_STATE_DEF): self.__stateTopLevelStmt,
+            (NT_SHAPE_DEF, T_SHAPE_NAME): self.__shapeDef,
+            (NT_STATE_DEF, T_STATE_NAME): self.__stateDef,
+            (NT_INSTATE_STMTS, NT_INSTATE_STMTS): self.__appendInstateStmt,
+            (NT_INSTATE_STMT, NT_BTN_HANDLER): self.__handlerInstateStmt,
+            (NT_VARIABLE_ASSIGN_STMT, T_VARIABLE): self.__variableAssignStmt,
+            (NT_SCREEN_UPDATE_STMT, T_CLEAR): self.__clear,
+            (NT_SCREEN_UPDATE_STMT, T_DISPLAY): self.__display,
+            (NT_GOTO_STMT, T_GOTO): self.__gotoStmt,
+            (NT_IF_STMT, T_IF): self.__ifStmt,
+            (NT_IF_NOT_STMT, T_IF): self.__ifNotStmt,
+            (NT_WHILE_STMT, T_WHILE): self.__whileStmt,
+            (NT_WHILE_NOT_STMT, T_WHILE): self.__whileNotStmt,
+            (NT_BTN_HANDLER, T_HANDLER_NAME): self.__btnHandler,
+        }
+        for listSymbol, itemSymbol in [(NT_INIF_STMTS, NT_INIF_STMT), (NT_INWHILE_STMTS, NT_INWHILE_STMT), (NT_INHANDLER_STMTS, NT_INHANDLER_STMT)]:
+            self.__reduceActions[(listSymbol, listSymbol)] = self.__appendStmt
+            self.__reduceActions[(listSymbol, itemSymbol)] = self.__firstStmt
+
+    def __passThrough(self, children):
+        child, = children
+        return child
+
+    def __instateStmt(self, children):
+        statement, = children
+        return [statement], {}
+
+    def getReduceAction(self, rule):
+        firstSymbol = rule.rhs.getSymbol(0).value
+        reduceAction = self.__reduceActions.get((rule.lhs, firstSymbol), None)
+        if reduceAction is not None:
+            return reduceAction
+        if rule.lhs == NT_INSTATE_STMT:
+            return self.__instateStmt
+        return self.__passThrough
+
+    def translateTerminal(self, tokenAndLexeme):
+        return tokenAndLexeme.lexeme
+
+    def translateStartSymbol(self, startSymbol, children):
+        initialStateName, _, (shapes, states), _ = children
+        return Game(states, initialStateName, shapes, self.__W, self.__H, self.__fps, self.__variableSlots)
+
+    def __expression(self, exprString):
+        return Expression(exprString, self.__variableSlots, errorHandler=self.__errorHandler)
+
+    def __singleExpr(self, children):
+        exprString, = children
+        return self.__expression(exprString)
+
+    def __randomExpr(self, children):
+        _, expr1String, expr2String = children
+        return RandomExpression(self.__expression(expr1String), self.__expression(expr2String))
+
+    def __appendTopLevelStmt(self, children):
+        (shapes, states), _, (newShapes, newStates) = children
+        shapes.update(newShapes)
+        states.update(newStates)
+        return shapes, states
+
+    def __shapeTopLevelStmt(self, children):
+        (shapeName, shape), = children
+        return {shapeName: shape}, {}
+
+    def __stateTopLevelStmt(self, children):
+        (stateName, state), = children
+        return {}, {stateName: state}
+
+    def __shapeDef(self, children):
+        shapeName, _, _, shapeString, _ = children
+        return shapeName, Shape.fromShapeString(shapeString)
+
+    def __stateDef(self, children):
+        stateName, _, _, (statements, handlers), _, _ = children
+        return stateName, GameState(StatementsBlock(statements), handlers)
+
+    def __appendInstateStmt(self, children):
+        (statements, handlers), _, (newStatements, newHandlers) = children
+        statements.extend(newStatements)
+        handlers.update(newHandlers)
+        return statements, handlers
+
+    def __handlerInstateStmt(self, children):
+        handler, = children
+        return [], handler
+
+    def __appendStmt(self, children):
+        statements, _, statement = children
+        statements.append(statement)
+        return statements
+
+    def __firstStmt(self, children):
+        statement, = children
+        return [statement]
+
+    def __variableAssignStmt(self, children):
+        variableName, _, expr = children
+        return VariableUpdateStatement(variableName, expr, self.__variableSlots)
+
+    def __clear(self, children):
+        return ClearScreenStatement()
+
+    def __display(self, children):
+        _, shapeName, _, _, xExpr, _, yExpr, _ = children
+        return DisplayShapeStatement(shapeName, xExpr, yExpr)
+
+    def __gotoStmt(self, children):
+        _, stateName = children
+        return GotoStatement(stateName)
+
+    def __ifStmt(self, children):
+        _, conditionExpr, _, _, statements, _, _ = children
+        return IfStatement(conditionExpr, StatementsBlock(statements))
+
+    def __ifNotStmt(self, children):
+        _, _, conditionExpr, _, _, statements, _, _ = children
+        return IfNotStatement(conditionExpr, StatementsBlock(statements))
+
+    def __whileStmt(self, children):
+        _, conditionExpr, _, _, statements, _, _ = children
+        return WhileStatement(conditionExpr, StatementsBlock(statements))
+
+    def __whileNotStmt(self, children):
+        _, _, conditionExpr, _, _, statements, _, _ = children
+        return WhileNotStatement(conditionExpr, StatementsBlock(statements))
+
+    def __btnHandler(self, children):
+        handlerName, _, _, statements, _, _ = children
+        def getButtonFromName(name): return {'@X': Button.X, '@Y': Button.Y, '@A': Button.A, '@B': Button.B, '@START': Button.START}.get(name)
+        return {getButtonFromName(handlerName): statements}
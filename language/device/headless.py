@@ -0,0 +1,63 @@
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class HeadlessRunReport:
+    ticks: int
+    seconds: float
+    frames: [str] = field(default_factory=list)
+
+    def getTicksPerSecond(self):
+        return self.ticks / self.seconds if self.seconds > 0 else float('inf')
+
+
+class HeadlessConsole:
+    BUTTONS = ('X', 'Y', 'A', 'B', 'START', 'POWER')
+
+    def __init__(self, game, W, H, fps):
+        assert W >= 1 and H >= 1 and fps >= 1, "Width, height and FPS must be positive integers"
+        W = int(W)
+        H = int(H)
+        fps = int(fps)
+        if not (game.getWidth() == W and game.getHeight() == H and game.getFps() == fps):
+            raise Exception(
+                f"Game ({game.getWidth()}×{game.getHeight()} @ {game.getFps()}Hz) does not support this device ({W}×{H} @ {fps}Hz)")
+        self.__game = game
+        self.__buttonHandlers = {
+            'X': game.onXPress,
+            'Y': game.onYPress,
+            'A': game.onAPress,
+            'B': game.onBPress,
+            'START': game.onStartPress,
+            'POWER': game.reset,
+        }
+
+    def press(self, button: str):
+        handler = self.__buttonHandlers.get(button)
+        if handler is None:
+            raise ValueError(f"Unknown button {button!r}, expected one of {', '.join(self.BUTTONS)}")
+        handler()
+
+    @staticmethod
+    def getFrame(display):
+        def getPixelChar(pixel): return '#' if pixel else '.'
+        return '\n'.join(''.join(map(getPixelChar, row)) for row in display.getPixelArray())
+
+    def run(self, ticks: int, presses=None, dumpFrames=False):
+        presses = presses if presses is not None else {}
+        for buttons in presses.values():
+            for button in buttons:
+                if button not in self.__buttonHandlers:
+                    raise ValueError(f"Unknown button {button!r}, expected one of {', '.join(self.BUTTONS)}")
+        game = self.__game
+        buttonHandlers = self.__buttonHandlers
+        frames = []
+        start = time.perf_counter()
+        for tickNumber in range(ticks):
+            for button in presses.get(tickNumber, ()):
+                buttonHandlers[button]()
+            game.tick()
+            if dumpFrames:
+                frames.append(self.getFrame(game.getDisplay()))
+        return HeadlessRunReport(ticks, time.perf_counter() - start, frames)
@@ -7,6 +7,10 @@ from pygame.locals import *
 from . import colors
 from enum import Enum
 import platform
+import time
+from .scheduler import FixedTimestepScheduler
+
+imageFromBytes = getattr(pygame.image, 'frombytes', pygame.image.fromstring)
 
 Size = namedtuple('Size', ['width', 'height'])
 Position = namedtuple('Position', ['x', 'y'])
@@ -28,8 +32,9 @@ class PixelState(Enum):
 
 
 class RetroConsole:
-    def __init__(self, game, W, H, fps):
+    def __init__(self, game, W, H, fps, renderFps=None, maxTicksPerFrame=5):
         assert W >= 1 and H >= 1 and fps >= 1, "Width, height and FPS must be positive integers"
+        assert renderFps is None or renderFps >= 1, "Render FPS must be a positive integer"
         if isWindowsPlatform():
             preventWindowScalingInWindows()
         W = int(W)
@@ -39,6 +44,10 @@ class RetroConsole:
             raise Exception(
                 f"Game ({game.getWidth()}×{game.getHeight()} @ {game.getFps()}Hz) does not support this device ({W}×{H} @ {fps}Hz)")
         self.__clockFrequencyInHertz = fps
+        self.__renderFrequencyInHertz = int(renderFps) if renderFps is not None else fps
+        self.__scheduler = FixedTimestepScheduler(fps, maxTicksPerFrame)
+        self.__renderedFrames = 0
+        self.__lastReport = None
         self.__displaySizeInPixels = Size(W, H)
 
         height = 800
@@ -68,29 +77,40 @@ class RetroConsole:
         self.__buttonHoleGap = 4
 
         self.__displaySurface = None
+        self.__bodySurface = None
         self.__isRunning = None
+        self.__drawnButtonStates = None
+        self.__drawnPoweredOn = None
+        self.__drawnPixelBytes = None
+        self.__gridSurfaces = {}
 
         self.__isPoweredOn = False
         self.aValueForTesting = 0
         self.__game = game
 
+    def getSchedulerStatistics(self):
+        return self.__scheduler.statistics
+
     def show(self):
         pygame.init()
-        fpsClock = pygame.time.Clock()
+        renderClock = pygame.time.Clock()
 
         self.__isRunning = True
         self.__displaySurface = pygame.display.set_mode(
             self.__pygameSurfaceSize)
         sizeString = f"{self.__displaySizeInPixels.width}×{self.__displaySizeInPixels.height}"
         freqString = f"{self.__clockFrequencyInHertz}Hz"
-        pygame.display.set_caption(
-            f"Retro Console - {sizeString} @ {freqString}")
+        self.__caption = f"Retro Console - {sizeString} @ {freqString}"
+        pygame.display.set_caption(self.__caption)
+        self.__scheduler.start()
+        self.__lastReport = (time.perf_counter(), 0, 0, 0)
         while self.__isRunning:
             self.__checkQuitEvent()
             self.__checkButtonPress()
-            self.__draw()
-            self.__update()
-            fpsClock.tick(self.__clockFrequencyInHertz)
+            self.__runDueTicks()
+            self.__update(self.__redraw())
+            self.__reportRates()
+            renderClock.tick(self.__renderFrequencyInHertz)
 
     def __checkQuitEvent(self):
         for event in pygame.event.get(QUIT):
@@ -150,7 +170,7 @@ class RetroConsole:
             self.__game.onStartPress()
 
     def __onPowerOn(self):
-        ...
+        self.__scheduler.start()
 
     def __onPowerOff(self):
         self.__game.reset()
@@ -159,17 +179,106 @@ class RetroConsole:
         return [[(i-j) < self.aValueForTesting for i in range(self.__displaySizeInPixels.width)]
                 for j in range(self.__displaySizeInPixels.height)]
 
-    def __getScreenPixels(self):
+    def __getScreenPixelBytes(self):
         if self.__isPoweredOn:
-            return self.__game.getDisplay().getPixelArray()
+            display = self.__game.getDisplay()
+            display.takeDirtyRegion()
+            return display.getPixelBytes()
         else:
             return None
 
+    def __getPixelSurface(self, pixelBytes: bytes):
+        pixelSurface = imageFromBytes(pixelBytes, self.__displaySizeInPixels, 'P')
+        pixelSurface.set_palette([Color((self.__pixelColor[state] << 8) + 0xff) for state in [PixelState.On0, PixelState.On1]])
+        return pixelSurface
+
+    def __getGridSurface(self):
+        lineColor = Color((self.__pixelSeparatorColor[int(self.__isPoweredOn)] << 8) + 0xff)
+        if self.__isPoweredOn not in self.__gridSurfaces:
+            W, H = self.__displaySizeInPixels
+            w = W * self.__pixelSize
+            h = H * self.__pixelSize
+            gridSurface = pygame.Surface((w + 1, h + 1), SRCALPHA)
+            for _x in range(W+1):
+                x = _x*self.__pixelSize
+                pygame.draw.line(gridSurface, lineColor, (x, 0), (x, h))
+            for _y in range(H+1):
+                y = _y*self.__pixelSize
+                pygame.draw.line(gridSurface, lineColor, (0, y), (w, y))
+            self.__gridSurfaces[self.__isPoweredOn] = gridSurface
+        return self.__gridSurfaces[self.__isPoweredOn]
+
+    def __blitPixels(self, pixelSurface, area: Rect):
+        origin = self.__getScreenOrigin()
+        position = (origin.x + area.x*self.__pixelSize, origin.y + area.y*self.__pixelSize)
+        scaledSize = (area.width*self.__pixelSize, area.height*self.__pixelSize)
+        self.__displaySurface.blit(pygame.transform.scale(pixelSurface.subsurface(area), scaledSize), position)
+        gridArea = Rect(area.x*self.__pixelSize, area.y*self.__pixelSize, scaledSize[0] + 1, scaledSize[1] + 1)
+        self.__displaySurface.blit(self.__getGridSurface(), position, gridArea)
+        return Rect(position, gridArea.size)
+
+    def __getButtonStates(self):
+        return (self.__xHeldDown, self.__yHeldDown, self.__aHeldDown, self.__bHeldDown, self.__powerHeldDown, self.__startHeldDown)
+
+    def __getScreenOrigin(self):
+        W, H = self.__displaySizeInPixels
+        horizontalMargin = (self.__pygameSurfaceSize.width - W * self.__pixelSize)//2
+        topMargin = self.__margin
+        return Position(horizontalMargin, topMargin)
+
+    def __getScreenRect(self):
+        W, H = self.__displaySizeInPixels
+        origin = self.__getScreenOrigin()
+        top = origin.y - self.__screenDepthFromBody
+        return Rect(origin.x, top, W * self.__pixelSize + 1, origin.y + H * self.__pixelSize + 1 - top)
+
+    def __getButtonAreaRect(self):
+        top = self.__margin + self.__screenAreaSize.height
+        return Rect(0, top, self.__pygameSurfaceSize.width, self.__pygameSurfaceSize.height - top)
+
     def __draw(self):
         self.__drawBody()
-        self.__drawScreen(self.__getScreenPixels())
+        self.__bodySurface = self.__displaySurface.copy()
+        self.__drawScreen(self.__getScreenPixelBytes())
         self.__drawButtons()
 
+    def __redraw(self):
+        if self.__bodySurface is None:
+            self.__draw()
+            return None
+        dirtyRects = []
+        if self.__getButtonStates() != self.__drawnButtonStates:
+            buttonAreaRect = self.__getButtonAreaRect()
+            self.__displaySurface.blit(self.__bodySurface, buttonAreaRect, buttonAreaRect)
+            self.__drawButtons()
+            dirtyRects.append(buttonAreaRect)
+        if self.__isPoweredOn != self.__drawnPoweredOn:
+            self.__drawScreen(self.__getScreenPixelBytes())
+            dirtyRects.append(self.__getScreenRect())
+        elif self.__isPoweredOn:
+            changedRect = self.__redrawChangedPixels()
+            if changedRect is not None:
+                dirtyRects.append(changedRect)
+        return dirtyRects
+
+    def __redrawChangedPixels(self):
+        display = self.__game.getDisplay()
+        dirtyRegion = display.takeDirtyRegion()
+        if dirtyRegion is None:
+            return None
+        pixelBytes = display.getPixelBytes()
+        drawnPixelBytes, self.__drawnPixelBytes = self.__drawnPixelBytes, pixelBytes
+        if pixelBytes == drawnPixelBytes:
+            return None
+        W = self.__displaySizeInPixels.width
+        left, right = dirtyRegion.left, dirtyRegion.right
+        changedRows = [_y for _y in range(dirtyRegion.top, dirtyRegion.bottom)
+                       if pixelBytes[_y*W + left: _y*W + right] != drawnPixelBytes[_y*W + left: _y*W + right]]
+        if len(changedRows) == 0:
+            return None
+        top, bottom = changedRows[0], changedRows[-1] + 1
+        return self.__blitPixels(self.__getPixelSurface(pixelBytes), Rect(left, top, right - left, bottom - top))
+
     def __drawBody(self):
         self.__displaySurface.fill(self.__bodyColor)
         strokeSize = 10
@@ -191,45 +300,21 @@ class RetroConsole:
                 end = getStroke2End(start)
                 self.__drawLine(start, end, strokeWidth, strokeColor)
 
-    def __drawScreen(self, pixels):
+    def __drawScreen(self, pixelBytes):
         W, H = self.__displaySizeInPixels
         w = W * self.__pixelSize
-        h = H * self.__pixelSize
-        horizontalMargin = (self.__pygameSurfaceSize.width - w)//2
-        topMargin = self.__margin
+        horizontalMargin, topMargin = self.__getScreenOrigin()
+        self.__drawnPoweredOn = self.__isPoweredOn
+        self.__drawnPixelBytes = pixelBytes
 
         pygame.draw.line(self.__displaySurface, self.__bodySideColor,
                          (horizontalMargin, topMargin), (horizontalMargin+w, topMargin), width=self.__screenDepthFromBody*2)
-        for _y in range(H):
-            for _x in range(W):
-                x = horizontalMargin + _x*self.__pixelSize
-                y = topMargin + _y*self.__pixelSize
-                self.__drawPixel(
-                    Position(x, y), (PixelState.On1 if pixels[_y][_x] else PixelState.On0) if self.__isPoweredOn else PixelState.Off)
-
-        lineColor = self.__pixelSeparatorColor[int(self.__isPoweredOn)]
-
-        for _x in range(W+1):
-            x = horizontalMargin + _x*self.__pixelSize
-            x1 = x
-            x2 = x
-            y1 = topMargin
-            y2 = topMargin + h
-            pygame.draw.line(self.__displaySurface,
-                             lineColor, (x1, y1), (x2, y2))
-        for _y in range(H+1):
-            y = topMargin + _y*self.__pixelSize
-            x1 = horizontalMargin
-            x2 = horizontalMargin + w
-            y1 = y
-            y2 = y
-            pygame.draw.line(self.__displaySurface,
-                             lineColor, (x1, y1), (x2, y2))
-
-    def __drawPixel(self, position: Position, state: PixelState):
-        pixelRect = Rect(*position, self.__pixelSize, self.__pixelSize)
-        color = self.__pixelColor[state]
-        pygame.draw.rect(self.__displaySurface, color, pixelRect)
+        if self.__isPoweredOn:
+            pixelSurface = self.__getPixelSurface(pixelBytes)
+        else:
+            pixelSurface = pygame.Surface((W, H))
+            pixelSurface.fill(Color((self.__pixelColor[PixelState.Off] << 8) + 0xff))
+        self.__blitPixels(pixelSurface, Rect(0, 0, W, H))
 
     def __drawButtons(self):
         W, H = self.__displaySizeInPixels
@@ -252,6 +337,7 @@ class RetroConsole:
                               controlButtonsAreaCenter.y + buttonOffsetFromCenter)
         b_position = Position(controlButtonsAreaCenter.x +
                               buttonOffsetFromCenter, controlButtonsAreaCenter.y)
+        self.__drawnButtonStates = self.__getButtonStates()
         self.__drawRoundButton(x_position, 'X', buttonRadius, self.__xHeldDown)
         self.__drawRoundButton(y_position, 'Y', buttonRadius, self.__yHeldDown)
         self.__drawRoundButton(a_position, 'A', buttonRadius, self.__aHeldDown)
@@ -349,7 +435,29 @@ class RetroConsole:
         rect.center = position
         self.__displaySurface.blit(rotatedRenderedText, rect)
 
-    def __update(self):
-        pygame.display.update()
-        if self.__isPoweredOn:
+    def __runDueTicks(self):
+        if not self.__isPoweredOn:
+            return
+        for _ in range(self.__scheduler.getDueTicks()):
             self.__game.tick()
+
+    def __update(self, dirtyRects):
+        if dirtyRects is None:
+            pygame.display.update()
+        elif dirtyRects:
+            pygame.display.update(dirtyRects)
+        self.__renderedFrames += 1
+
+    def __reportRates(self):
+        now = time.perf_counter()
+        lastTime, lastTicks, lastFrames, lastDroppedTicks = self.__lastReport
+        elapsed = now - lastTime
+        if elapsed < 1:
+            return
+        statistics = self.__scheduler.statistics
+        ticksPerSecond = (statistics.ticks - lastTicks) / elapsed
+        framesPerSecond = (self.__renderedFrames - lastFrames) / elapsed
+        droppedTicks = statistics.droppedTicks - lastDroppedTicks
+        pygame.display.set_caption(
+            f"{self.__caption} ({ticksPerSecond:.0f} ticks/s, {framesPerSecond:.0f} frames/s, {droppedTicks} dropped)")
+        self.__lastReport = (now, statistics.ticks, self.__renderedFrames, statistics.droppedTicks)
@@ -0,0 +1,52 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class SchedulerStatistics:
+    updates: int = 0
+    ticks: int = 0
+    droppedTicks: int = 0
+    maxTicksPerUpdate: int = 0
+    updatesWithoutTick: int = 0
+
+    def getTicksPerUpdate(self):
+        return self.ticks / self.updates if self.updates > 0 else 0.0
+
+
+class FixedTimestepScheduler:
+
+    def __init__(self, ticksPerSecond, maxTicksPerUpdate=5, clock=time.perf_counter):
+        assert ticksPerSecond >= 1 and maxTicksPerUpdate >= 1, "Tick rate and catch-up bound must be positive"
+        self.__tickDuration = 1 / ticksPerSecond
+        self.__maxTicksPerUpdate = int(maxTicksPerUpdate)
+        self.__clock = clock
+        self.__lastTime = None
+        self.__accumulatedTime = 0.0
+        self.statistics = SchedulerStatistics()
+
+    def start(self):
+        self.__lastTime = self.__clock()
+        self.__accumulatedTime = 0.0
+
+    def getDueTicks(self):
+        if self.__lastTime is None:
+            self.start()
+        now = self.__clock()
+        self.__accumulatedTime += now - self.__lastTime
+        self.__lastTime = now
+        dueTicks = int(self.__accumulatedTime // self.__tickDuration)
+        self.__accumulatedTime -= dueTicks * self.__tickDuration
+        statistics = self.statistics
+        if dueTicks > self.__maxTicksPerUpdate:
+            statistics.droppedTicks += dueTicks - self.__maxTicksPerUpdate
+            dueTicks = self.__maxTicksPerUpdate
+        statistics.updates += 1
+        statistics.ticks += dueTicks
+        statistics.maxTicksPerUpdate = max(statistics.maxTicksPerUpdate, dueTicks)
+        if dueTicks == 0:
+            statistics.updatesWithoutTick += 1
+        return dueTicks
+
+    def getLag(self):
+        return self.__accumulatedTime
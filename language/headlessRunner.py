@@ -0,0 +1,76 @@
+from device.headless import HeadlessConsole
+from compiler.main import Compiler, Backend, DisplayBackend
+from compiler.sourceReader import openSource
+import argparse
+import sys
+
+DEFAULT_W = 30
+DEFAULT_H = 30
+DEFAULT_FPS = 30
+DEFAULT_TICKS = 1000
+
+
+def showErrorAndTerminate(message):
+    print("Error:", message)
+    sys.exit(1)
+
+
+def positiveInteger(value: str):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def buttonPress(value: str):
+    tickString, _, button = value.partition(':')
+    try:
+        tickNumber = int(tickString)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected TICK:BUTTON, got {value}")
+    button = button.upper()
+    if tickNumber < 0 or button not in HeadlessConsole.BUTTONS:
+        raise argparse.ArgumentTypeError(f"expected TICK:BUTTON with a button in {', '.join(HeadlessConsole.BUTTONS)}, got {value}")
+    return tickNumber, button
+
+
+def parseArgs(args):
+    parser = argparse.ArgumentParser(prog='python3 headlessRunner.py', description='Run a game without a window as fast as possible.')
+    parser.add_argument('inputFilename')
+    parser.add_argument('--width', type=positiveInteger, default=DEFAULT_W)
+    parser.add_argument('--height', type=positiveInteger, default=DEFAULT_H)
+    parser.add_argument('--fps', type=positiveInteger, default=DEFAULT_FPS)
+    parser.add_argument('--ticks', type=positiveInteger, default=DEFAULT_TICKS)
+    parser.add_argument('--backend', choices=[Backend.INTERPRETER, Backend.CODEGEN], default=Backend.INTERPRETER)
+    parser.add_argument('--display', choices=[DisplayBackend.LISTS, DisplayBackend.NUMPY, DisplayBackend.BITS], default=DisplayBackend.LISTS)
+    parser.add_argument('--draw-list', action='store_true', help='record clear and display commands and draw them only when a frame is needed')
+    parser.add_argument('--press', type=buttonPress, action='append', default=[], metavar='TICK:BUTTON',
+                        help='press a button before the given tick (0-based); can be repeated')
+    parser.add_argument('--dump-frames', metavar='FILE', help='write the display after every tick to this file')
+    return parser.parse_args(args)
+
+
+options = parseArgs(sys.argv[1:])
+presses = {}
+for tickNumber, button in options.press:
+    presses.setdefault(tickNumber, []).append(button)
+
+try:
+    codeFile = openSource(options.inputFilename)
+except FileNotFoundError:
+    showErrorAndTerminate(f"File '{options.inputFilename}' not found")
+
+with codeFile:
+    compiler = Compiler.fromSource(codeFile, options.width, options.height, options.fps, errorHandler=showErrorAndTerminate,
+                                   backend=options.backend, displayBackend=options.display, drawList=options.draw_list)
+    game = compiler.compile()
+
+device = HeadlessConsole(game, options.width, options.height, options.fps)
+report = device.run(options.ticks, presses, dumpFrames=options.dump_frames is not None)
+
+if options.dump_frames is not None:
+    with open(options.dump_frames, 'w') as framesFile:
+        for tickNumber, frame in enumerate(report.frames):
+            framesFile.write(f"tick {tickNumber}\n{frame}\n\n")
+
+print(f"{report.ticks} ticks in {report.seconds:.3f}s ({report.getTicksPerSecond():.1f} ticks/s)")
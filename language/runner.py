@@ -1,5 +1,6 @@
 from device.main import RetroConsole
 from compiler.main import Compiler
+from compiler.sourceReader import openSource
 import sys
 
 args = sys.argv
@@ -7,6 +8,8 @@ args = sys.argv
 DEFAULT_W = 30
 DEFAULT_H = 30
 DEFAULT_FPS = 30
+PROFILE_COMPILE_FLAG = '--profile-compile'
+PROFILE_MEMORY_FLAG = '--profile-memory'
 
 
 def showErrorAndTerminate(message):
@@ -31,16 +34,21 @@ def processArgs(args):
     return inputFilename, W, H, FPS
 
 
-inputFilename, W, H, FPS = processArgs(sys.argv)
+profileMemory = PROFILE_MEMORY_FLAG in args
+profileCompile = PROFILE_COMPILE_FLAG in args or profileMemory
+inputFilename, W, H, FPS = processArgs([arg for arg in args if arg not in [PROFILE_COMPILE_FLAG, PROFILE_MEMORY_FLAG]])
 
 try:
-    with open(inputFilename, 'r') as codeFile:
-        code = codeFile.read()
+    codeFile = openSource(inputFilename)
 except FileNotFoundError:
     showErrorAndTerminate(f"File '{inputFilename}' not found")
 
-compiler = Compiler(code, W, H, FPS, errorHandler=showErrorAndTerminate)
-game = compiler.compile()
+with codeFile:
+    compiler = Compiler.fromSource(codeFile, W, H, FPS, errorHandler=showErrorAndTerminate, profile=profileCompile, profileMemory=profileMemory)
+    game = compiler.compile()
+
+if profileCompile:
+    print(compiler.getProfile())
 
 device = RetroConsole(game, W, H, FPS)
 device.show()